@@ -1,8 +1,31 @@
 import random
+import threading
 import time
 from constants import Color, PIECE_VALUES, AI_DIFFICULTY_DEPTHS, PieceType
+from piece import Piece
 import sunfish
 
+class _SearchCancelled(Exception):
+    """Raised inside a search whose cancel event was set"""
+
+class _CancellableSearcher(sunfish.Searcher):
+    def __init__(self, cancel):
+        """
+        Sunfish searcher that gives up as soon as it is cancelled
+
+        Args:
+            cancel: threading.Event that stops the search when set
+        """
+
+        super().__init__()
+        self._cancel = cancel
+
+    def bound(self, pos, gamma, depth, can_null=True):
+        # Every node of the search goes through here
+        if self._cancel.is_set():
+            raise _SearchCancelled
+        return super().bound(pos, gamma, depth, can_null)
+
 class ChessAI:
     def __init__(self, difficulty = "medium", ai_color = Color.BLACK):
         """
@@ -17,23 +40,40 @@ class ChessAI:
         self.depth = AI_DIFFICULTY_DEPTHS.get(difficulty, 2)
         self.ai_color = ai_color
 
-    def get_best_move(self, board):
+        # Material score of each board.snapshot() code from the AI's point of
+        # view (code 0 is an empty square)
+        self._snapshot_scores = [0] * (len(PieceType) * len(Color) + 1)
+        for piece_type in PieceType:
+            for color in Color:
+                value = PIECE_VALUES[piece_type.value]
+                code = Piece.get(piece_type, color).id + 1
+                self._snapshot_scores[code] = value if color == ai_color else -value
+
+    def get_best_move(self, board, cancel=None):
         """
         Get the best move given the current position
 
         Args:
-            board: ChessBoard instance
+            board: ChessBoard instance (may be left mid-search if cancelled)
+            cancel: optional threading.Event; setting it from another thread
+                stops the search early
 
         Returns:
-            Move if move available
+            Move if move available, None if there is none or the search
+            was cancelled
         """
 
-        if self.difficulty == "easy":
-            return self._get_random_move(board)
-        elif self.difficulty == "hard":
-            return self._get_sunfish_move(board)
-        else:
-            return self._get_minimax_move(board)
+        if cancel is None:
+            cancel = threading.Event()  # never set
+        try:
+            if self.difficulty == "easy":
+                return self._get_random_move(board)
+            elif self.difficulty == "hard":
+                return self._get_sunfish_move(board, cancel)
+            else:
+                return self._get_minimax_move(board, cancel)
+        except _SearchCancelled:
+            return None
 
     def _get_random_move(self, board):
         """
@@ -105,23 +145,23 @@ class ChessAI:
         white_king = board.get_piece(7, 4)
         white_qrook = board.get_piece(7, 0)
         white_krook = board.get_piece(7, 7)
-        wc_queenside = (white_king and not white_king.has_moved and
+        wc_queenside = (white_king and not board.has_moved(7, 4) and
                         white_qrook and white_qrook.piece_type == PieceType.ROOK and
-                        not white_qrook.has_moved)
-        wc_kingside = (white_king and not white_king.has_moved and
+                        not board.has_moved(7, 0))
+        wc_kingside = (white_king and not board.has_moved(7, 4) and
                        white_krook and white_krook.piece_type == PieceType.ROOK and
-                       not white_krook.has_moved)
+                       not board.has_moved(7, 7))
 
         # Black castling (bc): [queenside, kingside]
         black_king = board.get_piece(0, 4)
         black_qrook = board.get_piece(0, 0)
         black_krook = board.get_piece(0, 7)
-        bc_queenside = (black_king and not black_king.has_moved and
+        bc_queenside = (black_king and not board.has_moved(0, 4) and
                         black_qrook and black_qrook.piece_type == PieceType.ROOK and
-                        not black_qrook.has_moved)
-        bc_kingside = (black_king and not black_king.has_moved and
+                        not board.has_moved(0, 0))
+        bc_kingside = (black_king and not board.has_moved(0, 4) and
                        black_krook and black_krook.piece_type == PieceType.ROOK and
-                       not black_krook.has_moved)
+                       not board.has_moved(0, 7))
 
         wc = (wc_queenside, wc_kingside)
         bc = (bc_queenside, bc_kingside)
@@ -144,19 +184,20 @@ class ChessAI:
 
         return pos
 
-    def _get_sunfish_move(self, board):
+    def _get_sunfish_move(self, board, cancel):
         """
         Get best move using Sunfish engine
 
         Args:
             board: ChessBoard instance
+            cancel: threading.Event that stops the search when set
 
         Returns:
             Move tuple ((from_row, from_col), (to_row, to_col))
         """
         pos = self._board_to_sunfish_position(board)
 
-        searcher = sunfish.Searcher()
+        searcher = _CancellableSearcher(cancel)
 
         # Search with time limit
         start_time = time.time()
@@ -186,12 +227,13 @@ class ChessAI:
 
         return ((from_row, from_col), (to_row, to_col))
 
-    def _get_minimax_move(self, board):
+    def _get_minimax_move(self, board, cancel):
         """
         Get best move based on minimax algorithm
 
         Args:
             board: ChessBoard instance
+            cancel: threading.Event that stops the search when set
         """
 
         best_move = None
@@ -205,7 +247,7 @@ class ChessAI:
 
             # Make move, evaluate, then unmake (no deep copy needed)
             undo_info = board.make_move_with_undo(from_pos[0], from_pos[1], to_pos[0], to_pos[1])
-            value = self._minimax(board, self.depth - 1, float('-inf'), float('inf'), False)
+            value = self._minimax(board, self.depth - 1, float('-inf'), float('inf'), False, cancel)
             board.unmake_move(undo_info)
 
             if value > best_value:
@@ -213,7 +255,7 @@ class ChessAI:
                 best_move = (from_pos, to_pos)
         return best_move
 
-    def _minimax(self, board, depth, alpha, beta, maximizing):
+    def _minimax(self, board, depth, alpha, beta, maximizing, cancel):
         """
         Minimax algorithm with alpha-beta pruning
 
@@ -223,11 +265,15 @@ class ChessAI:
             alpha: Alpha value for pruning
             beta: Beta value for pruning
             maximizing: True if maximizing player, else False
+            cancel: threading.Event that stops the search when set
 
         Returns:
             Evaluation score
         """
 
+        if cancel.is_set():
+            raise _SearchCancelled
+
         if depth == 0 or board.is_checkmate() or board.is_stalemate():
             return self._evaluate_board(board)
 
@@ -237,7 +283,7 @@ class ChessAI:
             max_eval = float('-inf')
             for from_pos, to_pos in all_moves:
                 undo_info = board.make_move_with_undo(from_pos[0], from_pos[1], to_pos[0], to_pos[1])
-                eval_score = self._minimax(board, depth - 1, alpha, beta, False)
+                eval_score = self._minimax(board, depth - 1, alpha, beta, False, cancel)
                 board.unmake_move(undo_info)
                 max_eval = max(max_eval, eval_score)
                 alpha = max(alpha, eval_score)
@@ -248,7 +294,7 @@ class ChessAI:
             min_eval = float('inf')
             for from_pos, to_pos in all_moves:
                 undo_info = board.make_move_with_undo(from_pos[0], from_pos[1], to_pos[0], to_pos[1])
-                eval_score = self._minimax(board, depth - 1, alpha, beta, True)
+                eval_score = self._minimax(board, depth - 1, alpha, beta, True, cancel)
                 board.unmake_move(undo_info)
                 min_eval = min(min_eval, eval_score)
                 beta = min(beta, eval_score)
@@ -280,16 +326,6 @@ class ChessAI:
         if board.is_stalemate():
             return 0
 
-        # Material evaluation
-        score = 0
-        for r in range(8):
-            for c in range(8):
-                piece = board.get_piece(r, c)
-                if piece:
-                    value = PIECE_VALUES[piece.piece_type.value]
-                    if piece.color == self.ai_color:
-                        score += value  # Good for AI
-                    else:
-                        score -= value  # Bad for AI
-
-        return score
+        # Material evaluation: AI pieces count for the AI, opponent pieces against
+        scores = self._snapshot_scores
+        return sum([scores[code] for code in board.snapshot()])
@@ -8,10 +8,12 @@ class ChessBoard:
         Initialize the chess board object
         """
 
-        self.board = [[None for _ in range(8)] for _ in range(8)]
+        self.squares = [None] * 64  # indexed by row * 8 + col
         self.current_turn = Color.WHITE
         self.move_history = []
         self.en_passant_target = None
+        self.moved_squares = set()  # squares a move has started or ended on
+        self._check_square_stale = True  # recompute king_in_check_square on next read
         self.setup_board()
 
     def setup_board(self):
@@ -20,34 +22,52 @@ class ChessBoard:
         """
         # Pawns
         for i in range(8):
-            self.board[1][i] = Piece(PieceType.PAWN, Color.BLACK)
-            self.board[6][i] = Piece(PieceType.PAWN, Color.WHITE)
+            self.squares[1 * 8 + i] = Piece.get(PieceType.PAWN, Color.BLACK)
+            self.squares[6 * 8 + i] = Piece.get(PieceType.PAWN, Color.WHITE)
         
         # Rooks
-        self.board[0][0] = Piece(PieceType.ROOK, Color.BLACK)
-        self.board[0][7] = Piece(PieceType.ROOK, Color.BLACK)
-        self.board[7][0] = Piece(PieceType.ROOK, Color.WHITE)
-        self.board[7][7] = Piece(PieceType.ROOK, Color.WHITE)
+        self.squares[0] = Piece.get(PieceType.ROOK, Color.BLACK)
+        self.squares[7] = Piece.get(PieceType.ROOK, Color.BLACK)
+        self.squares[7 * 8] = Piece.get(PieceType.ROOK, Color.WHITE)
+        self.squares[7 * 8 + 7] = Piece.get(PieceType.ROOK, Color.WHITE)
         
         # Knights
-        self.board[0][1] = Piece(PieceType.KNIGHT, Color.BLACK)
-        self.board[0][6] = Piece(PieceType.KNIGHT, Color.BLACK)
-        self.board[7][1] = Piece(PieceType.KNIGHT, Color.WHITE)
-        self.board[7][6] = Piece(PieceType.KNIGHT, Color.WHITE)
+        self.squares[1] = Piece.get(PieceType.KNIGHT, Color.BLACK)
+        self.squares[6] = Piece.get(PieceType.KNIGHT, Color.BLACK)
+        self.squares[7 * 8 + 1] = Piece.get(PieceType.KNIGHT, Color.WHITE)
+        self.squares[7 * 8 + 6] = Piece.get(PieceType.KNIGHT, Color.WHITE)
         
         # Bishops
-        self.board[0][2] = Piece(PieceType.BISHOP, Color.BLACK)
-        self.board[0][5] = Piece(PieceType.BISHOP, Color.BLACK)
-        self.board[7][2] = Piece(PieceType.BISHOP, Color.WHITE)
-        self.board[7][5] = Piece(PieceType.BISHOP, Color.WHITE)
+        self.squares[2] = Piece.get(PieceType.BISHOP, Color.BLACK)
+        self.squares[5] = Piece.get(PieceType.BISHOP, Color.BLACK)
+        self.squares[7 * 8 + 2] = Piece.get(PieceType.BISHOP, Color.WHITE)
+        self.squares[7 * 8 + 5] = Piece.get(PieceType.BISHOP, Color.WHITE)
         
         # Queens
-        self.board[0][3] = Piece(PieceType.QUEEN, Color.BLACK)
-        self.board[7][3] = Piece(PieceType.QUEEN, Color.WHITE)
+        self.squares[3] = Piece.get(PieceType.QUEEN, Color.BLACK)
+        self.squares[7 * 8 + 3] = Piece.get(PieceType.QUEEN, Color.WHITE)
         
         # Kings
-        self.board[0][4] = Piece(PieceType.KING, Color.BLACK)
-        self.board[7][4] = Piece(PieceType.KING, Color.WHITE)
+        self.squares[4] = Piece.get(PieceType.KING, Color.BLACK)
+        self.squares[7 * 8 + 4] = Piece.get(PieceType.KING, Color.WHITE)
+
+    def copy(self):
+        """
+        Return an independent copy of the board (pieces are shared, since
+        they are never mutated)
+
+        Returns:
+            new ChessBoard with the same position and history
+        """
+
+        board = ChessBoard.__new__(ChessBoard)
+        board.squares = self.squares[:]
+        board.current_turn = self.current_turn
+        board.move_history = self.move_history[:]
+        board.en_passant_target = self.en_passant_target
+        board.moved_squares = set(self.moved_squares)
+        board._check_square_stale = True
+        return board
 
     def get_piece(self, row, col):
         """
@@ -62,8 +82,45 @@ class ChessBoard:
         """
 
         if 0 <= row < 8 and 0 <= col < 8:
-            return self.board[row][col]
+            return self.squares[row * 8 + col]
         return None
+
+    def iter_pieces(self):
+        """
+        Iterate over the occupied squares
+
+        Returns:
+            generator of (row, col, piece) tuples
+        """
+
+        for index, piece in enumerate(self.squares):
+            if piece is not None:
+                yield index // 8, index % 8, piece
+
+    def snapshot(self):
+        """
+        Pack the position into one byte per square
+
+        Returns:
+            bytes of length 64 indexed by row * 8 + col, holding Piece.id + 1
+            for occupied squares and 0 for empty ones
+        """
+
+        return bytes([piece.id + 1 if piece is not None else 0 for piece in self.squares])
+
+    def has_moved(self, row, col):
+        """
+        Check if the piece on a square has moved since the game started
+
+        Args:
+            row: row where piece is
+            col: column where piece is
+
+        Returns:
+            True if a move has started or ended on the square, else false
+        """
+
+        return (row, col) in self.moved_squares
     
     def get_valid_moves(self, row, col):
         """
@@ -104,28 +161,28 @@ class ChessBoard:
             list of moves
         """
 
-        piece = self.board[row][col]
+        piece = self.squares[row * 8 + col]
 
         if piece.piece_type == PieceType.PAWN:
-            moves = get_pawn_moves(self.board, row, col, self.en_passant_target)
+            moves = get_pawn_moves(self.squares, row, col, self.en_passant_target)
 
         elif piece.piece_type == PieceType.KNIGHT:
-            moves = get_knight_moves(self.board, row, col)
+            moves = get_knight_moves(self.squares, row, col)
 
         elif piece.piece_type == PieceType.BISHOP:
-            moves = get_bishop_moves(self.board, row, col)
+            moves = get_bishop_moves(self.squares, row, col)
 
         elif piece.piece_type == PieceType.ROOK:
-            moves = get_rook_moves(self.board, row, col)
+            moves = get_rook_moves(self.squares, row, col)
 
         elif piece.piece_type == PieceType.QUEEN:
-            moves = get_queen_moves(self.board, row, col)
+            moves = get_queen_moves(self.squares, row, col)
 
         elif piece.piece_type == PieceType.KING:
-            moves = get_king_moves(self.board, row, col)
+            moves = get_king_moves(self.squares, row, col)
 
             # Add castling moves
-            if not piece.has_moved and not self.is_in_check(piece.color):
+            if not self.has_moved(row, col) and not self.is_in_check(piece.color):
                 if self._can_castle_kingside(row, col):
                     moves.append((row, col + 2))
                 if self._can_castle_queenside(row, col):
@@ -147,13 +204,13 @@ class ChessBoard:
             True if kingside castling is possible, else false
         """
 
-        rook = self.board[row][7]
-        if not rook or rook.piece_type != PieceType.ROOK or rook.has_moved:
+        rook = self.squares[row * 8 + 7]
+        if not rook or rook.piece_type != PieceType.ROOK or self.has_moved(row, 7):
             return False
         
         # Check if squares are empty and not under attack
         for c in range(col + 1, 7):
-            if self.board[row][c] is not None:
+            if self.squares[row * 8 + c] is not None:
                 return False
             if c <= col + 2 and self._is_square_attacked(row, c, self.current_turn):
                 return False
@@ -172,13 +229,13 @@ class ChessBoard:
             True if queenside castling is possible, else false
         """
 
-        rook = self.board[row][0]
-        if not rook or rook.piece_type != PieceType.ROOK or rook.has_moved:
+        rook = self.squares[row * 8]
+        if not rook or rook.piece_type != PieceType.ROOK or self.has_moved(row, 0):
             return False
         
         # Check if squares are empty and not under attack
         for c in range(1, col):
-            if self.board[row][c] is not None:
+            if self.squares[row * 8 + c] is not None:
                 return False
             if c >= col - 2 and self._is_square_attacked(row, c, self.current_turn):
                 return False
@@ -201,26 +258,26 @@ class ChessBoard:
 
         for r in range(8):
             for c in range(8):
-                piece = self.board[r][c]
+                piece = self.squares[r * 8 + c]
                 if piece and piece.color == opponent_color:
                     # Get attack squares for this piece
                     if piece.piece_type == PieceType.PAWN:
-                        moves = get_pawn_attack_squares(self.board, r, c)
+                        moves = get_pawn_attack_squares(self.squares, r, c)
 
                     elif piece.piece_type == PieceType.KNIGHT:
-                        moves = get_knight_moves(self.board, r, c)
+                        moves = get_knight_moves(self.squares, r, c)
 
                     elif piece.piece_type == PieceType.BISHOP:
-                        moves = get_bishop_moves(self.board, r, c)
+                        moves = get_bishop_moves(self.squares, r, c)
 
                     elif piece.piece_type == PieceType.ROOK:
-                        moves = get_rook_moves(self.board, r, c)
+                        moves = get_rook_moves(self.squares, r, c)
 
                     elif piece.piece_type == PieceType.QUEEN:
-                        moves = get_queen_moves(self.board, r, c)
+                        moves = get_queen_moves(self.squares, r, c)
 
                     elif piece.piece_type == PieceType.KING:
-                        moves = get_king_attack_squares(self.board, r, c)
+                        moves = get_king_attack_squares(self.squares, r, c)
 
                     else:
                         moves = []
@@ -243,34 +300,55 @@ class ChessBoard:
         Returns:
             True if the move is legal, else false
         """
-        piece = self.board[from_row][from_col]
-        captured = self.board[to_row][to_col]
+        piece = self.squares[from_row * 8 + from_col]
+        captured = self.squares[to_row * 8 + to_col]
 
         # Handle en passant capture
         ep_captured = None
         ep_pos = None
         if piece.piece_type == PieceType.PAWN and self.en_passant_target == (to_row, to_col):
             ep_pos = (from_row, to_col)
-            ep_captured = self.board[from_row][to_col]
-            self.board[from_row][to_col] = None
+            ep_captured = self.squares[from_row * 8 + to_col]
+            self.squares[from_row * 8 + to_col] = None
 
         # Make the move
-        self.board[to_row][to_col] = piece
-        self.board[from_row][from_col] = None
+        self.squares[to_row * 8 + to_col] = piece
+        self.squares[from_row * 8 + from_col] = None
 
         # Check if king is in check
         in_check = self.is_in_check(self.current_turn)
 
         # Unmake the move
-        self.board[from_row][from_col] = piece
-        self.board[to_row][to_col] = captured
+        self.squares[from_row * 8 + from_col] = piece
+        self.squares[to_row * 8 + to_col] = captured
 
         # Restore en passant captured piece
         if ep_captured is not None:
-            self.board[ep_pos[0]][ep_pos[1]] = ep_captured
+            self.squares[ep_pos[0] * 8 + ep_pos[1]] = ep_captured
 
         return not in_check
 
+    @property
+    def king_in_check_square(self):
+        """
+        Square of the side to move's king if it is in check. Only the side to
+        move can be in check after a legal move, so this is recomputed lazily
+        once per move instead of on every read
+
+        Returns:
+            (row, col) of the checked king, or None
+        """
+
+        if self._check_square_stale:
+            self._king_in_check_square = None
+            for row, col, piece in self.iter_pieces():
+                if piece.piece_type == PieceType.KING and piece.color == self.current_turn:
+                    if self._is_square_attacked(row, col, self.current_turn):
+                        self._king_in_check_square = (row, col)
+                    break
+            self._check_square_stale = False
+        return self._king_in_check_square
+
     def is_in_check(self, color):
         """
         Check if king of given color is under check
@@ -282,7 +360,7 @@ class ChessBoard:
         king_pos = None
         for r in range(8):
             for c in range(8):
-                piece = self.board[r][c]
+                piece = self.squares[r * 8 + c]
                 if piece and piece.piece_type == PieceType.KING and piece.color == color:
                     king_pos = (r, c)
                     break
@@ -313,8 +391,24 @@ class ChessBoard:
         if (to_row, to_col) not in valid_moves:
             return False
 
-        piece = self.board[from_row][from_col]
-        captured_piece = self.board[to_row][to_col]
+        piece = self.squares[from_row * 8 + from_col]
+        captured_piece = self.squares[to_row * 8 + to_col]
+
+        # Fast path: most moves are neither pawn moves nor castling, so they
+        # need no en passant, promotion or rook handling
+        if piece.piece_type != PieceType.PAWN and \
+           (piece.piece_type != PieceType.KING or abs(to_col - from_col) != 2):
+            self.squares[to_row * 8 + to_col] = piece
+            self.squares[from_row * 8 + from_col] = None
+            self.moved_squares.update(((from_row, from_col), (to_row, to_col)))
+            self.en_passant_target = None
+            self.move_history.append(Move(from_position=(from_row, from_col), to_position=(to_row, to_col),
+                                          captured_piece=captured_piece, is_castling=False,
+                                          is_en_passant=False, promotion_piece=None))
+            self.current_turn = self.current_turn.opposite()
+            self._check_square_stale = True
+            return True
+
         is_castling = False
         is_en_passant = False
 
@@ -322,27 +416,25 @@ class ChessBoard:
         if piece.piece_type == PieceType.KING and abs(to_col - from_col) == 2:
             is_castling = True
             if to_col > from_col:  # Kingside
-                rook = self.board[from_row][7]
-                self.board[from_row][5] = rook
-                self.board[from_row][7] = None
-                rook.has_moved = True
+                self.squares[from_row * 8 + 5] = self.squares[from_row * 8 + 7]
+                self.squares[from_row * 8 + 7] = None
+                self.moved_squares.update(((from_row, 7), (from_row, 5)))
             else:  # Queenside
-                rook = self.board[from_row][0]
-                self.board[from_row][3] = rook
-                self.board[from_row][0] = None
-                rook.has_moved = True
+                self.squares[from_row * 8 + 3] = self.squares[from_row * 8]
+                self.squares[from_row * 8] = None
+                self.moved_squares.update(((from_row, 0), (from_row, 3)))
 
         # Handle en passant
         if piece.piece_type == PieceType.PAWN and self.en_passant_target == (to_row, to_col):
             is_en_passant = True
             captured_row = from_row
-            captured_piece = self.board[captured_row][to_col]
-            self.board[captured_row][to_col] = None
+            captured_piece = self.squares[captured_row * 8 + to_col]
+            self.squares[captured_row * 8 + to_col] = None
 
         # Make the move
-        self.board[to_row][to_col] = piece
-        self.board[from_row][from_col] = None
-        piece.has_moved = True
+        self.squares[to_row * 8 + to_col] = piece
+        self.squares[from_row * 8 + from_col] = None
+        self.moved_squares.update(((from_row, from_col), (to_row, to_col)))
 
         # Set en passant target
         self.en_passant_target = None
@@ -350,19 +442,20 @@ class ChessBoard:
             self.en_passant_target = ((from_row + to_row) // 2, to_col)
 
         # Handle pawn promotion
-        promoted = False
+        promoted = None
         if piece.piece_type == PieceType.PAWN and (to_row == 0 or to_row == 7):
-            piece.piece_type = promotion_piece if promotion_piece else PieceType.QUEEN
-            promoted = True
+            promoted = Piece.get(promotion_piece if promotion_piece else PieceType.QUEEN, piece.color)
+            self.squares[to_row * 8 + to_col] = promoted
 
         # Record move
         move = Move(from_position=(from_row, from_col), to_position=(to_row, to_col),
                    captured_piece=captured_piece, is_castling=is_castling,
-                   is_en_passant=is_en_passant, promotion_piece=piece if promoted else None)
+                   is_en_passant=is_en_passant, promotion_piece=promoted)
         self.move_history.append(move)
 
         # Switch turns
         self.current_turn = self.current_turn.opposite()
+        self._check_square_stale = True
 
         return True
     
@@ -380,11 +473,7 @@ class ChessBoard:
             True if the move is a pawn promotion
         """
         piece = self.get_piece(from_row, from_col)
-        if piece and piece.piece_type == PieceType.PAWN:
-            if (piece.color == Color.WHITE and to_row == 0) or \
-               (piece.color == Color.BLACK and to_row == 7):
-                return True
-        return False
+        return piece is not None and piece.piece_type == PieceType.PAWN and to_row == (0 if piece.color == Color.WHITE else 7)
 
     def is_checkmate(self):
         """
@@ -395,7 +484,7 @@ class ChessBoard:
 
         for r in range(8):
             for c in range(8):
-                piece = self.board[r][c]
+                piece = self.squares[r * 8 + c]
                 if piece and piece.color == self.current_turn:
                     if len(self.get_valid_moves(r, c)) > 0:
                         return False
@@ -411,7 +500,7 @@ class ChessBoard:
 
         for r in range(8):
             for c in range(8):
-                piece = self.board[r][c]
+                piece = self.squares[r * 8 + c]
                 if piece and piece.color == self.current_turn:
                     if len(self.get_valid_moves(r, c)) > 0:
                         return False
@@ -430,7 +519,7 @@ class ChessBoard:
 
         for r in range(8):
             for c in range(8):
-                piece = self.board[r][c]
+                piece = self.squares[r * 8 + c]
                 if piece:
                     if piece.color == Color.WHITE:
                         pieces['white'].append((piece.piece_type, r, c))
@@ -488,25 +577,25 @@ class ChessBoard:
             from_row, from_col = move.from_position
             to_row, to_col = move.to_position
             promotion = move.promotion_piece.piece_type if move.promotion_piece else None
-            temp_board.board[to_row][to_col] = temp_board.board[from_row][from_col]
-            temp_board.board[from_row][from_col] = None
+            temp_board.squares[to_row * 8 + to_col] = temp_board.squares[from_row * 8 + from_col]
+            temp_board.squares[from_row * 8 + from_col] = None
 
             # Handle castling
             if move.is_castling:
                 if to_col > from_col:  # Kingside
-                    temp_board.board[from_row][5] = temp_board.board[from_row][7]
-                    temp_board.board[from_row][7] = None
+                    temp_board.squares[from_row * 8 + 5] = temp_board.squares[from_row * 8 + 7]
+                    temp_board.squares[from_row * 8 + 7] = None
                 else:  # Queenside
-                    temp_board.board[from_row][3] = temp_board.board[from_row][0]
-                    temp_board.board[from_row][0] = None
+                    temp_board.squares[from_row * 8 + 3] = temp_board.squares[from_row * 8]
+                    temp_board.squares[from_row * 8] = None
 
             # Handle en passant
             if move.is_en_passant:
-                temp_board.board[from_row][to_col] = None
+                temp_board.squares[from_row * 8 + to_col] = None
 
             # Handle promotion
             if promotion:
-                temp_board.board[to_row][to_col].piece_type = promotion
+                temp_board.squares[to_row * 8 + to_col] = Piece.get(promotion, temp_board.squares[to_row * 8 + to_col].color)
 
             temp_board.current_turn = temp_board.current_turn.opposite()
             positions.append(temp_board._get_position_key())
@@ -522,7 +611,7 @@ class ChessBoard:
         key = []
         for r in range(8):
             for c in range(8):
-                piece = self.board[r][c]
+                piece = self.squares[r * 8 + c]
                 if piece:
                     key.append((r, c, piece.piece_type.value, piece.color.value))
         key.append(self.current_turn.value)
@@ -544,7 +633,7 @@ class ChessBoard:
             from_row, from_col = move.from_position
             # We need to check what piece made the move - look at to_position
             to_row, to_col = move.to_position
-            piece = self.board[to_row][to_col]
+            piece = self.squares[to_row * 8 + to_col]
             if piece and piece.piece_type == PieceType.PAWN:
                 return False
             # Also check promotion (which means a pawn moved)
@@ -561,7 +650,7 @@ class ChessBoard:
         all_moves = []
         for r in range(8):
             for c in range(8):
-                piece = self.board[r][c]
+                piece = self.squares[r * 8 + c]
                 if piece and piece.color == self.current_turn:
                     moves = self.get_valid_moves(r, c)
                     for move in moves:
@@ -587,8 +676,8 @@ class ChessBoard:
         if (to_row, to_col) not in valid_moves:
             return None
 
-        piece = self.board[from_row][from_col]
-        captured_piece = self.board[to_row][to_col]
+        piece = self.squares[from_row * 8 + from_col]
+        captured_piece = self.squares[to_row * 8 + to_col]
 
         # Store undo information
         undo_info = {
@@ -598,53 +687,54 @@ class ChessBoard:
             'to_col': to_col,
             'piece': piece,
             'captured_piece': captured_piece,
-            'prev_has_moved': piece.has_moved,
+            'new_moved_squares': None,
             'prev_en_passant': self.en_passant_target,
             'is_castling': False,
             'is_en_passant': False,
-            'is_promotion': False,
-            'prev_piece_type': piece.piece_type,
             'rook_from': None,
             'rook_to': None,
             'rook': None,
-            'rook_prev_has_moved': None,
             'ep_captured_pos': None,
             'ep_captured_piece': None,
         }
 
+        touched = [(from_row, from_col), (to_row, to_col)]
+
         # Handle castling
         if piece.piece_type == PieceType.KING and abs(to_col - from_col) == 2:
             undo_info['is_castling'] = True
             if to_col > from_col:  # Kingside
-                rook = self.board[from_row][7]
+                rook = self.squares[from_row * 8 + 7]
                 undo_info['rook'] = rook
                 undo_info['rook_from'] = (from_row, 7)
                 undo_info['rook_to'] = (from_row, 5)
-                undo_info['rook_prev_has_moved'] = rook.has_moved
-                self.board[from_row][5] = rook
-                self.board[from_row][7] = None
-                rook.has_moved = True
+                self.squares[from_row * 8 + 5] = rook
+                self.squares[from_row * 8 + 7] = None
             else:  # Queenside
-                rook = self.board[from_row][0]
+                rook = self.squares[from_row * 8]
                 undo_info['rook'] = rook
                 undo_info['rook_from'] = (from_row, 0)
                 undo_info['rook_to'] = (from_row, 3)
-                undo_info['rook_prev_has_moved'] = rook.has_moved
-                self.board[from_row][3] = rook
-                self.board[from_row][0] = None
-                rook.has_moved = True
+                self.squares[from_row * 8 + 3] = rook
+                self.squares[from_row * 8] = None
+            touched.append(undo_info['rook_from'])
+            touched.append(undo_info['rook_to'])
 
         # Handle en passant
         if piece.piece_type == PieceType.PAWN and self.en_passant_target == (to_row, to_col):
             undo_info['is_en_passant'] = True
             undo_info['ep_captured_pos'] = (from_row, to_col)
-            undo_info['ep_captured_piece'] = self.board[from_row][to_col]
-            self.board[from_row][to_col] = None
+            undo_info['ep_captured_piece'] = self.squares[from_row * 8 + to_col]
+            self.squares[from_row * 8 + to_col] = None
 
         # Make the move
-        self.board[to_row][to_col] = piece
-        self.board[from_row][from_col] = None
-        piece.has_moved = True
+        self.squares[to_row * 8 + to_col] = piece
+        self.squares[from_row * 8 + from_col] = None
+
+        # Remember which squares this move marks as moved so unmake can clear them
+        new_moved_squares = [sq for sq in touched if sq not in self.moved_squares]
+        self.moved_squares.update(new_moved_squares)
+        undo_info['new_moved_squares'] = new_moved_squares
 
         # Set en passant target
         self.en_passant_target = None
@@ -653,11 +743,11 @@ class ChessBoard:
 
         # Handle pawn promotion
         if piece.piece_type == PieceType.PAWN and (to_row == 0 or to_row == 7):
-            undo_info['is_promotion'] = True
-            piece.piece_type = PieceType.QUEEN
+            self.squares[to_row * 8 + to_col] = Piece.get(PieceType.QUEEN, piece.color)
 
         # Switch turns
         self.current_turn = self.current_turn.opposite()
+        self._check_square_stale = True
 
         return undo_info
 
@@ -670,6 +760,7 @@ class ChessBoard:
         """
         # Switch turns back
         self.current_turn = self.current_turn.opposite()
+        self._check_square_stale = True
 
         from_row = undo_info['from_row']
         from_col = undo_info['from_col']
@@ -677,14 +768,10 @@ class ChessBoard:
         to_col = undo_info['to_col']
         piece = undo_info['piece']
 
-        # Undo promotion
-        if undo_info['is_promotion']:
-            piece.piece_type = undo_info['prev_piece_type']
-
-        # Move piece back
-        self.board[from_row][from_col] = piece
-        self.board[to_row][to_col] = undo_info['captured_piece']
-        piece.has_moved = undo_info['prev_has_moved']
+        # Move piece back (this also undoes a promotion)
+        self.squares[from_row * 8 + from_col] = piece
+        self.squares[to_row * 8 + to_col] = undo_info['captured_piece']
+        self.moved_squares.difference_update(undo_info['new_moved_squares'])
 
         # Restore en passant target
         self.en_passant_target = undo_info['prev_en_passant']
@@ -694,14 +781,13 @@ class ChessBoard:
             rook = undo_info['rook']
             rook_from = undo_info['rook_from']
             rook_to = undo_info['rook_to']
-            self.board[rook_from[0]][rook_from[1]] = rook
-            self.board[rook_to[0]][rook_to[1]] = None
-            rook.has_moved = undo_info['rook_prev_has_moved']
+            self.squares[rook_from[0] * 8 + rook_from[1]] = rook
+            self.squares[rook_to[0] * 8 + rook_to[1]] = None
 
         # Undo en passant capture
         if undo_info['is_en_passant']:
             ep_pos = undo_info['ep_captured_pos']
-            self.board[ep_pos[0]][ep_pos[1]] = undo_info['ep_captured_piece']
+            self.squares[ep_pos[0] * 8 + ep_pos[1]] = undo_info['ep_captured_piece']
 
     def get_captured_pieces(self):
         """
@@ -811,39 +897,39 @@ class ChessBoard:
         notation_list = []
 
         # Create a temporary board to replay
-        temp_board = [[None for _ in range(8)] for _ in range(8)]
+        temp_board = [None] * 64
 
         # Setup initial position
         for i in range(8):
-            temp_board[1][i] = Piece(PieceType.PAWN, Color.BLACK)
-            temp_board[6][i] = Piece(PieceType.PAWN, Color.WHITE)
+            temp_board[1 * 8 + i] = Piece.get(PieceType.PAWN, Color.BLACK)
+            temp_board[6 * 8 + i] = Piece.get(PieceType.PAWN, Color.WHITE)
 
-        temp_board[0][0] = Piece(PieceType.ROOK, Color.BLACK)
-        temp_board[0][7] = Piece(PieceType.ROOK, Color.BLACK)
-        temp_board[7][0] = Piece(PieceType.ROOK, Color.WHITE)
-        temp_board[7][7] = Piece(PieceType.ROOK, Color.WHITE)
+        temp_board[0] = Piece.get(PieceType.ROOK, Color.BLACK)
+        temp_board[7] = Piece.get(PieceType.ROOK, Color.BLACK)
+        temp_board[7 * 8] = Piece.get(PieceType.ROOK, Color.WHITE)
+        temp_board[7 * 8 + 7] = Piece.get(PieceType.ROOK, Color.WHITE)
 
-        temp_board[0][1] = Piece(PieceType.KNIGHT, Color.BLACK)
-        temp_board[0][6] = Piece(PieceType.KNIGHT, Color.BLACK)
-        temp_board[7][1] = Piece(PieceType.KNIGHT, Color.WHITE)
-        temp_board[7][6] = Piece(PieceType.KNIGHT, Color.WHITE)
+        temp_board[1] = Piece.get(PieceType.KNIGHT, Color.BLACK)
+        temp_board[6] = Piece.get(PieceType.KNIGHT, Color.BLACK)
+        temp_board[7 * 8 + 1] = Piece.get(PieceType.KNIGHT, Color.WHITE)
+        temp_board[7 * 8 + 6] = Piece.get(PieceType.KNIGHT, Color.WHITE)
 
-        temp_board[0][2] = Piece(PieceType.BISHOP, Color.BLACK)
-        temp_board[0][5] = Piece(PieceType.BISHOP, Color.BLACK)
-        temp_board[7][2] = Piece(PieceType.BISHOP, Color.WHITE)
-        temp_board[7][5] = Piece(PieceType.BISHOP, Color.WHITE)
+        temp_board[2] = Piece.get(PieceType.BISHOP, Color.BLACK)
+        temp_board[5] = Piece.get(PieceType.BISHOP, Color.BLACK)
+        temp_board[7 * 8 + 2] = Piece.get(PieceType.BISHOP, Color.WHITE)
+        temp_board[7 * 8 + 5] = Piece.get(PieceType.BISHOP, Color.WHITE)
 
-        temp_board[0][3] = Piece(PieceType.QUEEN, Color.BLACK)
-        temp_board[7][3] = Piece(PieceType.QUEEN, Color.WHITE)
+        temp_board[3] = Piece.get(PieceType.QUEEN, Color.BLACK)
+        temp_board[7 * 8 + 3] = Piece.get(PieceType.QUEEN, Color.WHITE)
 
-        temp_board[0][4] = Piece(PieceType.KING, Color.BLACK)
-        temp_board[7][4] = Piece(PieceType.KING, Color.WHITE)
+        temp_board[4] = Piece.get(PieceType.KING, Color.BLACK)
+        temp_board[7 * 8 + 4] = Piece.get(PieceType.KING, Color.WHITE)
 
         for move in self.move_history:
             from_row, from_col = move.from_position
             to_row, to_col = move.to_position
 
-            piece = temp_board[from_row][from_col]
+            piece = temp_board[from_row * 8 + from_col]
             if not piece:
                 notation_list.append("???")
                 continue
@@ -874,24 +960,24 @@ class ChessBoard:
             notation_list.append(notation)
 
             # Update temp board
-            temp_board[to_row][to_col] = piece
-            temp_board[from_row][from_col] = None
+            temp_board[to_row * 8 + to_col] = piece
+            temp_board[from_row * 8 + from_col] = None
 
             # Handle castling rook movement
             if move.is_castling:
                 if to_col > from_col:  # Kingside
-                    temp_board[from_row][5] = temp_board[from_row][7]
-                    temp_board[from_row][7] = None
+                    temp_board[from_row * 8 + 5] = temp_board[from_row * 8 + 7]
+                    temp_board[from_row * 8 + 7] = None
                 else:  # Queenside
-                    temp_board[from_row][3] = temp_board[from_row][0]
-                    temp_board[from_row][0] = None
+                    temp_board[from_row * 8 + 3] = temp_board[from_row * 8]
+                    temp_board[from_row * 8] = None
 
             # Handle en passant
             if move.is_en_passant:
-                temp_board[from_row][to_col] = None
+                temp_board[from_row * 8 + to_col] = None
 
             # Handle promotion
             if move.promotion_piece:
-                temp_board[to_row][to_col].piece_type = move.promotion_piece.piece_type
+                temp_board[to_row * 8 + to_col] = move.promotion_piece
 
         return notation_list
\ No newline at end of file
@@ -6,6 +6,9 @@ BOARD_SIZE = 640
 BOARD_OFFSET = 80
 SQUARE_SIZE = BOARD_SIZE // 8
 FPS = 60
+HIDDEN_FPS = 10  # Loop rate while the window is minimized
+TEXT_CACHE_SIZE = 256  # Max rendered text surfaces kept by the renderer
+TIME_TEXT_CACHE_SIZE = 600  # Max rendered clock readings (10 minutes of seconds)
 
 # Colors
 LIGHT_SQUARE = (240, 217, 181)
@@ -29,6 +32,7 @@ AI_DIFFICULTY_DEPTHS = {
     'medium': 3,
     'hard': 3  # unused - hard uses Sunfish engine
 }
+AI_MOVE_DELAY = 300  # Minimum time in ms before the AI's move is shown
 
 # Piece values
 PIECE_VALUES = {
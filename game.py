@@ -1,10 +1,15 @@
 import pygame
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from board import ChessBoard
 from ai import ChessAI
 from renderer import Renderer
-from constants import Color, WINDOW_SIZE, BOARD_OFFSET, BOARD_SIZE, SQUARE_SIZE, FPS
+from constants import Color, WINDOW_SIZE, BOARD_OFFSET, BOARD_SIZE, SQUARE_SIZE, FPS, HIDDEN_FPS, AI_MOVE_DELAY
 
 class ChessGame:
+    MENU_MODES = (None, 'pvb_difficulty_select', 'pvb_color_select', 'pvp_time_select')
+
     def __init__(self):
         """
         Initialize the chess game
@@ -15,17 +20,28 @@ class ChessGame:
         pygame.display.set_caption("Chess Game")
         self.clock = pygame.time.Clock()
 
+        # Only queue the events run() handles; SDL drops everything else
+        # before it reaches Python
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+                                  pygame.MOUSEMOTION, pygame.KEYDOWN, pygame.TEXTINPUT,
+                                  pygame.WINDOWEXPOSED])
+
         # Game state
         self.board = ChessBoard()
         self.renderer = Renderer(self.screen)
         self.selected_square = None
-        self.valid_moves = []
+        self.valid_moves = frozenset()
         self.last_move = None  # (from_square, to_square) for highlighting
         self.pending_promotion = None  # (from_row, from_col, to_row, to_col) awaiting piece selection
         self.game_mode = None  # 'pvp' or 'pvb'
         self.player_color = None  # Color.WHITE or Color.BLACK (for PvBot mode)
         self.ai_difficulty = None  # 'easy', 'medium', or 'hard'
         self.ai = None
+        self._ai_pool = ThreadPoolExecutor(max_workers=1)  # AI searches run off the UI thread
+        self._ai_future = None  # Pending AI search, if any
+        self._ai_cancel = None  # Event that stops the pending AI search
+        self._ai_ready_at = 0  # Tick before which the AI's move is held back
         self.game_over = False
         self.winner = None
         self.draw_reason = None
@@ -48,12 +64,32 @@ class ChessGame:
             'black_minutes': '',
             'white_seconds': '',
             'black_seconds': '',
-            'active_field': None  # Which field is being edited
+            'active_field': None,  # Which field is being edited
+            'time_valid': False  # Both players have time > 0, kept up to date on every edit
         }
 
         # Move history panel state
         self.show_move_history = False
 
+        # (state, clock) summary of the last presented frame, see _present_frame
+        self._last_frame_key = None
+
+        # Menu button rects, cached per (game_mode, time_input) state
+        self._menu_layout = None
+        self._menu_layout_key = None
+
+        # Key handlers for the time control menu and for everything else
+        self._time_menu_key_handlers = {
+            pygame.K_BACKSPACE: self._on_time_backspace,
+            pygame.K_TAB: self._on_time_tab,
+            pygame.K_ESCAPE: self._on_time_escape,
+        }
+        self._game_key_handlers = {
+            pygame.K_r: self._on_restart,
+            pygame.K_q: self._on_quit,
+            pygame.K_ESCAPE: self._on_escape_to_menu,
+        }
+
     def run(self):
         """
         Main game loop
@@ -61,11 +97,17 @@ class ChessGame:
         running = True
 
         while running:
-            self.clock.tick(FPS)
+            # While minimized nothing can be seen, so only keep the clocks,
+            # the AI and the event queue going, at a lower rate
+            visible = pygame.display.get_active()
+            self.clock.tick(FPS if visible else HIDDEN_FPS)
 
             # Update timer if game is active
             self._update_timer()
 
+            # Apply the AI's move once its search has finished
+            self._poll_ai_move()
+
             # event handling
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
@@ -87,23 +129,53 @@ class ChessGame:
                 if event.type == pygame.TEXTINPUT:
                     self._handle_text_input(event.text)
 
-            self._render()
-            pygame.display.flip()
+                # The window contents were lost, so the next frame must be redrawn
+                if event.type == pygame.WINDOWEXPOSED:
+                    self._last_frame_key = None
 
+            if visible:
+                self._present_frame()
+
+        # Drop a queued search and stop a running one, otherwise the
+        # interpreter would wait for the worker thread to finish it before exiting
+        self._cancel_ai_move()
+        self._ai_pool.shutdown(wait=False)
         pygame.quit()
 
     def _update_timer(self):
         """
         Update the active player's timer
+
+        The clock is only charged when its displayed second would change or
+        the player would run out of time, so most frames skip the timer math.
         """
         if not self.use_timer or self.game_over or self.game_mode != 'pvp':
             return
 
+        current_tick = pygame.time.get_ticks()
         if self.last_tick is None:
-            self.last_tick = pygame.time.get_ticks()
+            self.last_tick = current_tick
             return
 
-        current_tick = pygame.time.get_ticks()
+        elapsed = current_tick - self.last_tick
+        remaining = self.white_time if self.board.current_turn == Color.WHITE else self.black_time
+        if elapsed <= remaining % 1000 and elapsed < remaining:
+            return
+
+        self._charge_clock(current_tick)
+
+    def _charge_clock(self, current_tick=None):
+        """
+        Subtract the time since the last charge from the active player's clock
+
+        Args:
+            current_tick: pygame tick to charge up to (default: now)
+        """
+        if not self.use_timer or self.game_over or self.game_mode != 'pvp' or self.last_tick is None:
+            return
+
+        if current_tick is None:
+            current_tick = pygame.time.get_ticks()
         elapsed = current_tick - self.last_tick
         self.last_tick = current_tick
 
@@ -142,6 +214,7 @@ class ChessGame:
             max_len = 2 if 'seconds' in active else 3
             if len(current) < max_len:
                 self.time_input[active] = current + text
+                self._update_time_valid()
     
     def _handle_mouse_down(self, pos):
         """
@@ -154,8 +227,7 @@ class ChessGame:
             True to continue running, else false
         """
 
-        menu_modes = [None, 'pvb_difficulty_select', 'pvb_color_select', 'pvp_time_select']
-        if self.game_mode in menu_modes:
+        if self.game_mode in self.MENU_MODES:
             # Handle menu clicks
             return self._handle_menu_click(pos)
         else:
@@ -197,101 +269,144 @@ class ChessGame:
             True to continue running, else false
         """
 
-        buttons = self.renderer.draw_menu(self.game_mode, self.time_input)
+        buttons = self._get_menu_layout()
+
+        # Run the handler of the first target under the mouse
+        for rect, handler in self._menu_click_targets(buttons):
+            if rect.collidepoint(pos):
+                handler()
+                break
+
+        return True
+
+    def _get_menu_layout(self):
+        """
+        Return the clickable rects of the current menu, recomputed only
+        when the menu or the time input changes
+
+        Returns:
+            Tuple of buttons or dict with input rects
+        """
+
+        key = (self.game_mode, tuple(self.time_input.values()))
+        if key != self._menu_layout_key:
+            self._menu_layout = self.renderer.get_menu_layout(self.game_mode, self.time_input)
+            self._menu_layout_key = key
+        return self._menu_layout
+
+    def _menu_click_targets(self, buttons):
+        """
+        Pair each clickable rect of the current menu with its handler
+
+        Args:
+            buttons: rects returned by the renderer for the current menu
+
+        Returns:
+            list of (rect, handler) pairs in hit-test order
+        """
 
-        # Unpack buttons based on game mode
         if self.game_mode is None:
             # Main menu: mode selection
             pvp_button, pvb_button = buttons
+            return [(pvp_button, self._open_time_menu),
+                    (pvb_button, self._open_difficulty_menu)]
 
-            if pvp_button.collidepoint(pos):
-                self.game_mode = 'pvp_time_select'
-                self._reset_time_input()
-            elif pvb_button.collidepoint(pos):
-                self.game_mode = 'pvb_difficulty_select'
-                # Show difficulty selection next
-
-        elif self.game_mode == 'pvp_time_select':
-            # Time control selection for PvP
-            result = buttons  # This is a dict with input rects and buttons
-            input_rects = result['input_rects']
-            start_button = result['start_button']
-            no_time_button = result['no_time_button']
-            back_button = result['back_button']
-
-            # Check input field clicks
-            for field_name, rect in input_rects.items():
-                if rect.collidepoint(pos):
-                    self.time_input['active_field'] = field_name
-                    return True
-
-            if start_button.collidepoint(pos):
-                # Validate time - must be greater than 0 for both players
-                white_min = int(self.time_input['white_minutes'] or '0')
-                white_sec = int(self.time_input['white_seconds'] or '0')
-                black_min = int(self.time_input['black_minutes'] or '0')
-                black_sec = int(self.time_input['black_seconds'] or '0')
-
-                white_total = white_min * 60 + white_sec
-                black_total = black_min * 60 + black_sec
-
-                # Only start if both players have time > 0
-                if white_total > 0 and black_total > 0:
-                    self.game_mode = 'pvp'
-                    self.player_color = None
-                    self.use_timer = True
-                    self._reset_timer_for_game()
-                    self.reset_game()
-            elif no_time_button.collidepoint(pos):
-                # Start game without time control
-                self.game_mode = 'pvp'
-                self.player_color = None
-                self.use_timer = False
-                self.reset_game()
-            elif back_button.collidepoint(pos):
-                self.game_mode = None
-                self._reset_time_input()
-
-        elif self.game_mode == 'pvb_difficulty_select':
+        if self.game_mode == 'pvp_time_select':
+            # Time control selection for PvP (input fields take priority)
+            targets = [(rect, partial(self._set_active_field, field_name))
+                       for field_name, rect in buttons['input_rects'].items()]
+            targets.append((buttons['start_button'], self._start_timed_game))
+            targets.append((buttons['no_time_button'], self._start_untimed_game))
+            targets.append((buttons['back_button'], self._leave_time_menu))
+            return targets
+
+        if self.game_mode == 'pvb_difficulty_select':
             # Difficulty selection menu for PvBot
             easy_button, medium_button, hard_button, back_button = buttons
-            
-            if easy_button.collidepoint(pos):
-                self.ai_difficulty = 'easy'
-                self.game_mode = 'pvb_color_select'
-            elif medium_button.collidepoint(pos):
-                self.ai_difficulty = 'medium'
-                self.game_mode = 'pvb_color_select'
-            elif hard_button.collidepoint(pos):
-                self.ai_difficulty = 'hard'
-                self.game_mode = 'pvb_color_select'
-            elif back_button.collidepoint(pos):
-                self.game_mode = None
-                self.ai_difficulty = None
-
-        elif self.game_mode == 'pvb_color_select':
+            return [(easy_button, partial(self._choose_difficulty, 'easy')),
+                    (medium_button, partial(self._choose_difficulty, 'medium')),
+                    (hard_button, partial(self._choose_difficulty, 'hard')),
+                    (back_button, self._leave_difficulty_menu)]
+
+        if self.game_mode == 'pvb_color_select':
             # Color selection menu for PvBot
             white_button, black_button, back_button = buttons
-            
-            if white_button.collidepoint(pos):
-                self.game_mode = 'pvb'
-                self.player_color = Color.WHITE
-                ai_color = Color.BLACK
-                self.ai = ChessAI(difficulty=self.ai_difficulty, ai_color=ai_color)
-                self.reset_game()
-            elif black_button.collidepoint(pos):
-                self.game_mode = 'pvb'
-                self.player_color = Color.BLACK
-                ai_color = Color.WHITE
-                self.ai = ChessAI(difficulty=self.ai_difficulty, ai_color=ai_color)
-                self.reset_game()
-                # AI makes first move
-                if ai_color == Color.WHITE:
-                    self._make_ai_move()
-            elif back_button.collidepoint(pos):
-                self.game_mode = 'pvb_difficulty_select'
-        
-        return True
+            return [(white_button, partial(self._choose_color, Color.WHITE)),
+                    (black_button, partial(self._choose_color, Color.BLACK)),
+                    (back_button, self._open_difficulty_menu)]
+
+        return []
+
+    def _open_time_menu(self):
+        """Show the PvP time control menu"""
+        self.game_mode = 'pvp_time_select'
+        self._reset_time_input()
+
+    def _open_difficulty_menu(self):
+        """Show the PvBot difficulty menu"""
+        self.game_mode = 'pvb_difficulty_select'
+
+    def _set_active_field(self, field_name):
+        """
+        Focus a time input field
+
+        Args:
+            field_name: key of the field in time_input
+        """
+        self.time_input['active_field'] = field_name
+
+    def _start_timed_game(self):
+        """Start a PvP game with the entered time control, if it is valid"""
+        # Only start if both players have time > 0
+        if self.time_input['time_valid']:
+            self.game_mode = 'pvp'
+            self.player_color = None
+            self.use_timer = True
+            self._reset_timer_for_game()
+            self.reset_game()
+
+    def _start_untimed_game(self):
+        """Start a PvP game without time control"""
+        self.game_mode = 'pvp'
+        self.player_color = None
+        self.use_timer = False
+        self.reset_game()
+
+    def _leave_time_menu(self):
+        """Go back from the time control menu to the main menu"""
+        self.game_mode = None
+        self._reset_time_input()
+
+    def _leave_difficulty_menu(self):
+        """Go back from the difficulty menu to the main menu"""
+        self.game_mode = None
+        self.ai_difficulty = None
+
+    def _choose_difficulty(self, difficulty):
+        """
+        Pick the AI difficulty and show the color menu
+
+        Args:
+            difficulty: 'easy', 'medium', or 'hard'
+        """
+        self.ai_difficulty = difficulty
+        self.game_mode = 'pvb_color_select'
+
+    def _choose_color(self, player_color):
+        """
+        Start a PvBot game with the player on the given side
+
+        Args:
+            player_color: Color the player plays
+        """
+        self.game_mode = 'pvb'
+        self.player_color = player_color
+        ai_color = player_color.opposite()
+        self.ai = ChessAI(difficulty=self.ai_difficulty, ai_color=ai_color)
+        self.reset_game()
+        # AI makes first move
+        if ai_color == Color.WHITE:
+            self._start_ai_move()
     
     def _handle_board_mouse_down(self, pos):
         """
@@ -337,7 +452,7 @@ class ChessGame:
             self.drag_start = (row, col)
             self.drag_pos = pos
             self.selected_square = (row, col)
-            self.valid_moves = self.board.get_valid_moves(row, col)
+            self.valid_moves = frozenset(self.board.get_valid_moves(row, col))
         elif self.selected_square:
             # Try to make a move (click-to-move fallback)
             self._try_make_move(row, col)
@@ -396,7 +511,7 @@ class ChessGame:
                 self._select_piece(to_row, to_col)
             else:
                 self.selected_square = None
-                self.valid_moves = []
+                self.valid_moves = frozenset()
             return
 
         # Check if this is a promotion move
@@ -419,20 +534,22 @@ class ChessGame:
             to_col: ending column
             promotion_piece: PieceType for promotion (optional)
         """
+        # Charge the mover for time not yet taken off their clock
+        self._charge_clock()
+        if self.game_over:
+            return
+
         if self.board.make_move(from_row, from_col, to_row, to_col, promotion_piece):
             # Move successful
             self.last_move = ((from_row, from_col), (to_row, to_col))
             self.selected_square = None
-            self.valid_moves = []
+            self.valid_moves = frozenset()
             self.pending_promotion = None
             self._check_game_over()
 
             # AI move (if playing against bot and it's AI's turn)
             if self.game_mode == 'pvb' and self.board.current_turn != self.player_color and not self.game_over:
-                # Render the player's move before AI thinks
-                self._render()
-                pygame.display.flip()
-                self._make_ai_move()
+                self._start_ai_move()
 
     def _select_piece(self, row, col):
         """
@@ -446,7 +563,7 @@ class ChessGame:
         piece = self.board.get_piece(row, col)
         if piece and piece.color == self.board.current_turn:
             self.selected_square = (row, col)
-            self.valid_moves = self.board.get_valid_moves(row, col)
+            self.valid_moves = frozenset(self.board.get_valid_moves(row, col))
 
     def _handle_promotion_click(self, pos):
         """
@@ -473,15 +590,48 @@ class ChessGame:
         # Click outside dialog - cancel promotion
         self.pending_promotion = None
         self.selected_square = None
-        self.valid_moves = []
+        self.valid_moves = frozenset()
+
+    def _start_ai_move(self):
+        """
+        Start searching for the AI's move on a worker thread
+
+        The search runs on a copy of the board so the main loop can keep
+        handling events and rendering the current position meanwhile.
+        """
+
+        self._ai_ready_at = pygame.time.get_ticks() + AI_MOVE_DELAY  # Small delay for better UX
+        self._ai_cancel = threading.Event()
+        self._ai_future = self._ai_pool.submit(self.ai.get_best_move, self.board.copy(), self._ai_cancel)
+
+    def _cancel_ai_move(self):
+        """
+        Stop the pending AI search, if any, and forget its result
+
+        A search that has not started is dropped from the queue; a running
+        one stops at its next node, so the worker is free for the next search.
+        """
+
+        if self._ai_future is None:
+            return
+        self._ai_future.cancel()
+        self._ai_cancel.set()
+        self._ai_future = None
+        self._ai_cancel = None
 
-    def _make_ai_move(self):
+    def _poll_ai_move(self):
         """
-        Make the AI's move
+        Make the AI's move if its search has finished
         """
 
-        pygame.time.wait(300)  # Small delay for better UX
-        ai_move = self.ai.get_best_move(self.board)
+        if self._ai_future is None or not self._ai_future.done():
+            return
+        if pygame.time.get_ticks() < self._ai_ready_at:
+            return
+
+        ai_move = self._ai_future.result()
+        self._ai_future = None
+        self._ai_cancel = None
 
         if ai_move:
             from_pos, to_pos = ai_move
@@ -500,45 +650,56 @@ class ChessGame:
             True to continue running, else false
         """
 
-        # Handle backspace for time input
         if self.game_mode == 'pvp_time_select':
-            if key == pygame.K_BACKSPACE:
-                active = self.time_input['active_field']
-                if active and self.time_input[active]:
-                    self.time_input[active] = self.time_input[active][:-1]
-            elif key == pygame.K_TAB:
-                # Cycle through input fields
-                fields = ['white_minutes', 'white_seconds', 'black_minutes', 'black_seconds']
-                active = self.time_input['active_field']
-                if active in fields:
-                    idx = (fields.index(active) + 1) % len(fields)
-                    self.time_input['active_field'] = fields[idx]
-            elif key == pygame.K_ESCAPE:
-                # Go back to main menu
-                self.game_mode = None
-                self._reset_time_input()
-            return True
+            handler = self._time_menu_key_handlers.get(key)
+        else:
+            handler = self._game_key_handlers.get(key)
+        return handler() if handler else True
 
-        if key == pygame.K_r:
-            # Restart game
-            self.reset_game()
-            # Reset timer
-            if self.use_timer:
-                self._reset_timer_for_game()
-            # If AI plays white, make first move
-            if self.game_mode == 'pvb' and self.ai and self.ai.ai_color == Color.WHITE:
-                self._make_ai_move()
-        elif key == pygame.K_q:
-            # Quit
-            return False
-        elif key == pygame.K_ESCAPE:
-            # Return to menu
-            self.game_mode = None
-            self.player_color = None
-            self.ai = None
-            self.use_timer = False
-            self.reset_game()
+    def _on_time_backspace(self):
+        """Delete the last character of the active time input field"""
+        active = self.time_input['active_field']
+        if active and self.time_input[active]:
+            self.time_input[active] = self.time_input[active][:-1]
+            self._update_time_valid()
+        return True
+
+    def _on_time_tab(self):
+        """Cycle through the time input fields"""
+        fields = ['white_minutes', 'white_seconds', 'black_minutes', 'black_seconds']
+        active = self.time_input['active_field']
+        if active in fields:
+            idx = (fields.index(active) + 1) % len(fields)
+            self.time_input['active_field'] = fields[idx]
+        return True
+
+    def _on_time_escape(self):
+        """Go back to main menu from the time control menu"""
+        self._leave_time_menu()
+        return True
 
+    def _on_restart(self):
+        """Restart the current game"""
+        self.reset_game()
+        # Reset timer
+        if self.use_timer:
+            self._reset_timer_for_game()
+        # If AI plays white, make first move
+        if self.game_mode == 'pvb' and self.ai and self.ai.ai_color == Color.WHITE:
+            self._start_ai_move()
+        return True
+
+    def _on_quit(self):
+        """Quit the game"""
+        return False
+
+    def _on_escape_to_menu(self):
+        """Return to the main menu"""
+        self.game_mode = None
+        self.player_color = None
+        self.ai = None
+        self.use_timer = False
+        self.reset_game()
         return True
 
     def _reset_time_input(self):
@@ -548,9 +709,21 @@ class ChessGame:
             'black_minutes': '',
             'white_seconds': '',
             'black_seconds': '',
-            'active_field': None
+            'active_field': None,
+            'time_valid': False
         }
 
+    def _update_time_valid(self):
+        """Recompute whether both players have been given time greater than 0"""
+        white_min = int(self.time_input['white_minutes'] or '0')
+        white_sec = int(self.time_input['white_seconds'] or '0')
+        black_min = int(self.time_input['black_minutes'] or '0')
+        black_sec = int(self.time_input['black_seconds'] or '0')
+
+        white_total = white_min * 60 + white_sec
+        black_total = black_min * 60 + black_sec
+        self.time_input['time_valid'] = white_total > 0 and black_total > 0
+
     def _reset_timer_for_game(self):
         """Reset timers to initial values for a new game"""
         # Parse time input and convert to milliseconds
@@ -574,12 +747,13 @@ class ChessGame:
             tuple of the square
         """
 
-        x, y = pos
-        if BOARD_OFFSET <= x < BOARD_OFFSET + BOARD_SIZE and BOARD_OFFSET <= y < BOARD_OFFSET + BOARD_SIZE:
-            col = (x - BOARD_OFFSET) // SQUARE_SIZE
-            row = (y - BOARD_OFFSET) // SQUARE_SIZE
-            return (row, col)
-        return None
+        dx = pos[0] - BOARD_OFFSET
+        dy = pos[1] - BOARD_OFFSET
+
+        # (dx | dy) is negative if either offset is, so one test covers both lower bounds
+        if (dx | dy) < 0 or dx >= BOARD_SIZE or dy >= BOARD_SIZE:
+            return None
+        return (dy // SQUARE_SIZE, dx // SQUARE_SIZE)
     
     def _check_game_over(self):
         """
@@ -628,7 +802,7 @@ class ChessGame:
         # reset constants
         self.board = ChessBoard()
         self.selected_square = None
-        self.valid_moves = []
+        self.valid_moves = frozenset()
         self.last_move = None
         self.pending_promotion = None
         self.game_over = False
@@ -636,6 +810,9 @@ class ChessGame:
         self.draw_reason = None
         self.show_move_history = False
 
+        # Stop any search still running for the previous game
+        self._cancel_ai_move()
+
         # Reset drag state
         self.dragging = False
         self.drag_piece = None
@@ -651,22 +828,103 @@ class ChessGame:
             self.ai = ChessAI(difficulty="medium", ai_color=Color.BLACK)
             self.player_color = Color.WHITE
 
-    def _render(self):
+    def _frame_key(self, mouse_pos):
+        """
+        Summarize everything that affects what is on screen
+
+        Args:
+            mouse_pos: Mouse position (x, y) for this frame
+
+        Returns:
+            (state, hover, clock) tuple, where hover holds one flag per
+            hoverable rect (so mouse movement only matters when the cursor
+            enters or leaves one), clock holds the displayed timer seconds
+            (or None) and state holds everything else
+        """
+
+        hover = tuple(rect.collidepoint(mouse_pos) for rect in self._hover_rects())
+        if self.game_mode in self.MENU_MODES:
+            return (self.game_mode, tuple(self.time_input.values())), hover, None
+
+        state = (self.game_mode, self.board, len(self.board.move_history), self.selected_square,
+                 self.valid_moves, self.last_move, self.drag_pos if self.dragging else None,
+                 self.pending_promotion, self.show_move_history, self.game_over, self.winner,
+                 self.draw_reason)
+        clock = None
+        if self.use_timer and self.game_mode == 'pvp':
+            clock = (self.white_time // 1000, self.black_time // 1000, self.board.current_turn)
+        return state, hover, clock
+
+    def _hover_rects(self):
+        """
+        Get the rects on screen that are drawn differently under the cursor
+
+        Returns:
+            list of pygame.Rect, fixed for a given state
+        """
+
+        if self.game_mode in self.MENU_MODES:
+            return [rect for rect, _ in self._menu_click_targets(self._get_menu_layout())]
+
+        rects = [self.renderer.get_history_button_rect()]
+        if self.pending_promotion:
+            _, _, to_row, to_col = self.pending_promotion
+            rects.extend(self.renderer.get_promotion_rects(to_row, to_col, self.board.current_turn))
+        return rects
+
+    def _present_frame(self):
+        """
+        Render the frame and update the display, doing only as much work as
+        the changes since the last frame require
+        """
+
+        # One mouse read per frame, shared by the frame key and the drawing
+        mouse_pos = pygame.mouse.get_pos()
+        frame_key = self._frame_key(mouse_pos)
+        last_key = self._last_frame_key
+        self._last_frame_key = frame_key
+
+        # Nothing changed, the display already shows this frame
+        if frame_key == last_key:
+            return
+
+        self._render(mouse_pos)
+        if last_key is None or last_key[0] != frame_key[0]:
+            pygame.display.flip()
+            return
+
+        # Only hover states or the clocks changed, so only those rects need
+        # to reach the display
+        _, hover, clock = frame_key
+        _, last_hover, last_clock = last_key
+        dirty_rects = [rect for rect, was_hovered, is_hovered in zip(self._hover_rects(), last_hover, hover)
+                       if was_hovered != is_hovered]
+        if clock != last_clock:
+            dirty_rects.extend(self.renderer.get_timer_rects())
+        pygame.display.update(dirty_rects)
+
+    def _render(self, mouse_pos=None):
         """
         Render the current game state
+
+        Args:
+            mouse_pos: Mouse position (x, y) for hover effects, or None to
+                read it now
         """
 
-        menu_modes = [None, 'pvb_difficulty_select', 'pvb_color_select', 'pvp_time_select']
-        if self.game_mode in menu_modes:
+        if mouse_pos is None:
+            mouse_pos = pygame.mouse.get_pos()
+        self.renderer.begin_frame(mouse_pos)
+
+        if self.game_mode in self.MENU_MODES:
             # Draw menu (main menu, difficulty selection, color selection, or time selection)
-            self.renderer.draw_menu(self.game_mode, self.time_input)
+            self.renderer.draw_menu(self.game_mode, self.time_input, self._get_menu_layout())
 
         else:
             # Draw game
-            self.screen.fill((49, 46, 43))  # BG_COLOR
-            self.renderer.draw_board(self.board, self.selected_square, self.valid_moves, self.last_move)
-            self.renderer.draw_pieces(self.board, self.drag_start if self.dragging else None)
-            self.renderer.draw_coordinates()
+            self.renderer.draw_background()
+            self.renderer.draw_board_region(self.board, self.selected_square, self.valid_moves, self.last_move,
+                                            self.drag_start if self.dragging else None)
 
             # Prepare timer info
             timer_info = None
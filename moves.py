@@ -1,12 +1,22 @@
 from constants import PieceType, Color
 from piece import Piece
 
+# Move directions as (row, col) offsets
+KNIGHT_DIRS = ((-2, -1), (-2, 1), (-1, -2), (-1, 2),
+               (1, -2), (1, 2), (2, -1), (2, 1))
+BISHOP_DIRS = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+ROOK_DIRS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+QUEEN_DIRS = ((-1, -1), (-1, 0), (-1, 1), (0, -1),
+              (0, 1), (1, -1), (1, 0), (1, 1))
+KING_DIRS = QUEEN_DIRS
+PAWN_CAPTURE_COLS = (-1, 1)
+
 def get_pawn_moves(board, row, col, en_passant_target):
     """
     Generate moves for a pawn
 
     Args:
-        board: array of the board state
+        board: flat list of the board state, indexed by row * 8 + col
         row: row where pawn is
         col: column where pawn is
         en_passant_target: target for en passant moves
@@ -16,24 +26,26 @@ def get_pawn_moves(board, row, col, en_passant_target):
     """
 
     moves = []
-    piece = board[row][col]
-    direction = -1 if piece.color == Color.WHITE else 1
+    piece = board[row * 8 + col]
+    color = piece.color
+    direction = -1 if color == Color.WHITE else 1
 
     # forward moves
     new_row = row + direction
-    if 0 <= new_row < 8 and board[new_row][col] is None:
+    if 0 <= new_row < 8 and board[new_row * 8 + col] is None:
         moves.append((new_row, col))
 
-        # Double move
-        if not piece.has_moved and board[row + 2 * direction][col] is None:
+        # Double move (a pawn still on its starting rank has never moved)
+        start_row = 6 if color == Color.WHITE else 1
+        if row == start_row and board[(row + 2 * direction) * 8 + col] is None:
             moves.append((row + 2 * direction, col))
     
     # Captures
-    for dir in [-1, 1]:
-        new_col = col + dir
+    for dc in PAWN_CAPTURE_COLS:
+        new_col = col + dc
         if 0 <= new_row < 8 and 0 <= new_col < 8:
-            target = board[new_row][new_col]
-            if target and target.color != piece.color:
+            target = board[new_row * 8 + new_col]
+            if target and target.color != color:
                 moves.append((new_row, new_col))
             
             # en passant
@@ -46,7 +58,7 @@ def get_knight_moves(board, row, col):
     Generate moves for a knight
 
     Args:
-        board: array of the board state
+        board: flat list of the board state, indexed by row * 8 + col
         row: row where pawn is
         col: column where pawn is
     
@@ -55,16 +67,14 @@ def get_knight_moves(board, row, col):
     """
 
     moves = []
-    piece = board[row][col]
-    directions = [(-2, -1), (-2, 1), (-1, -2), (-1, 2),
-                        (1, -2), (1, 2), (2, -1), (2, 1)]
-    
-    for dir in directions:
-        new_row = dir[0] + row
-        new_col = dir[1] + col
+    color = board[row * 8 + col].color
+
+    for dr, dc in KNIGHT_DIRS:
+        new_row = row + dr
+        new_col = col + dc
         if 0 <= new_row < 8 and 0 <= new_col < 8:
-            target = board[new_row][new_col]
-            if not target or target.color != piece.color:
+            target = board[new_row * 8 + new_col]
+            if not target or target.color != color:
                 moves.append((new_row, new_col))
     return moves
 
@@ -73,7 +83,7 @@ def get_sliding_moves(board, row, col, directions):
     Generate moves for any sliding pieces
 
     Args:
-        board: array of the board state
+        board: flat list of the board state, indexed by row * 8 + col
         row: row where pawn is
         col: column where pawn is
         directions: what directions to travel
@@ -83,22 +93,23 @@ def get_sliding_moves(board, row, col, directions):
     """
 
     moves = []
-    piece = board[row][col]
+    color = board[row * 8 + col].color
 
-    for dir in directions:
-        new_row = row + dir[0]
-        new_col = col + dir[1]
+    # Unpack each direction once instead of indexing the tuple per step
+    for dr, dc in directions:
+        new_row = row + dr
+        new_col = col + dc
         while 0 <= new_row < 8 and 0 <= new_col < 8:
-            target = board[new_row][new_col]
+            target = board[new_row * 8 + new_col]
             if not target:
                 moves.append((new_row, new_col))
-            elif target.color != piece.color:
+            elif target.color != color:
                 moves.append((new_row, new_col))
                 break
             else:
                 break
-            new_row += dir[0]
-            new_col += dir[1]
+            new_row += dr
+            new_col += dc
     return moves
 
 def get_bishop_moves(board, row, col):
@@ -106,7 +117,7 @@ def get_bishop_moves(board, row, col):
     Generate moves for bishop
 
     Args:
-        board: array of the board state
+        board: flat list of the board state, indexed by row * 8 + col
         row: row where pawn is
         col: column where pawn is
     
@@ -114,15 +125,14 @@ def get_bishop_moves(board, row, col):
         list of possble moves
     """
 
-    directions = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
-    return get_sliding_moves(board, row, col, directions)
+    return get_sliding_moves(board, row, col, BISHOP_DIRS)
 
 def get_rook_moves(board, row, col):
     """
     Generate moves for rook
 
     Args:
-        board: array of the board state
+        board: flat list of the board state, indexed by row * 8 + col
         row: row where pawn is
         col: column where pawn is
     
@@ -130,15 +140,14 @@ def get_rook_moves(board, row, col):
         list of possble moves
     """
 
-    directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-    return get_sliding_moves(board, row, col, directions)
+    return get_sliding_moves(board, row, col, ROOK_DIRS)
 
 def get_queen_moves(board, row, col):
     """
     Generate moves for queen
 
     Args:
-        board: array of the board state
+        board: flat list of the board state, indexed by row * 8 + col
         row: row where pawn is
         col: column where pawn is
     
@@ -146,16 +155,14 @@ def get_queen_moves(board, row, col):
         list of possble moves
     """
 
-    directions = [(-1, -1), (-1, 0), (-1, 1), (0, -1), 
-                      (0, 1), (1, -1), (1, 0), (1, 1)]
-    return get_sliding_moves(board, row, col, directions)
+    return get_sliding_moves(board, row, col, QUEEN_DIRS)
 
 def get_king_moves(board, row, col):
     """
     Generate moves for king
 
     Args:
-        board: array of the board state
+        board: flat list of the board state, indexed by row * 8 + col
         row: row where pawn is
         col: column where pawn is
     
@@ -164,17 +171,14 @@ def get_king_moves(board, row, col):
     """
 
     moves = []
-    piece = board[row][col]
-
-    for dr in [-1, 0, 1]:
-        for dc in [-1, 0, 1]:
-            if dr == 0 and dc == 0:
-                continue
-            new_row, new_col = row + dr, col + dc
-            if 0 <= new_row < 8 and 0 <= new_col < 8:
-                target = board[new_row][new_col]
-                if not target or target.color != piece.color:
-                    moves.append((new_row, new_col))
+    color = board[row * 8 + col].color
+
+    for dr, dc in KING_DIRS:
+        new_row, new_col = row + dr, col + dc
+        if 0 <= new_row < 8 and 0 <= new_col < 8:
+            target = board[new_row * 8 + new_col]
+            if not target or target.color != color:
+                moves.append((new_row, new_col))
     
     return moves
 
@@ -183,7 +187,7 @@ def get_pawn_attack_squares(board, row, col):
     Generate moves for king
 
     Args:
-        board: array of the board state
+        board: flat list of the board state, indexed by row * 8 + col
         row: row where pawn is
         col: column where pawn is
     
@@ -191,11 +195,11 @@ def get_pawn_attack_squares(board, row, col):
         squares attacked by a pawn
     """
 
-    piece = board[row][col]
+    piece = board[row * 8 + col]
     direction = -1 if piece.color == Color.WHITE else 1
     attacks = []
 
-    for dc in [-1, 1]:
+    for dc in PAWN_CAPTURE_COLS:
         new_row = row + direction
         new_col = col + dc
         if 0 <= new_row < 8 and 0 <= new_col < 8:
@@ -208,7 +212,7 @@ def get_king_attack_squares(board, row, col):
     Generate squares attacked by a king
 
     Args:
-        board: array of the board state
+        board: flat list of the board state, indexed by row * 8 + col
         row: row where pawn is
         col: column where pawn is
     
@@ -217,13 +221,10 @@ def get_king_attack_squares(board, row, col):
     """
      
     attacks = []
-    for dr in [-1, 0, 1]:
-        for dc in [-1, 0, 1]:
-            if dr == 0 and dc == 0:
-                continue
-            new_row = row + dr
-            new_col = col + dc
-            if 0 <= new_row < 8 and 0 <= new_col < 8:
-                attacks.append((new_row, new_col))
+    for dr, dc in KING_DIRS:
+        new_row = row + dr
+        new_col = col + dc
+        if 0 <= new_row < 8 and 0 <= new_col < 8:
+            attacks.append((new_row, new_col))
     return attacks
     
@@ -1,11 +1,21 @@
 from constants import PieceType, Color
 from typing import Optional
 
+# Fixed orderings used to number pieces
+_COLORS = tuple(Color)
+_PIECE_TYPES = tuple(PieceType)
+
 class Piece:
+    __slots__ = ('piece_type', 'color', 'id')
+
     def __init__(self, piece_type, color):
         """
         Initialize a chess piece
 
+        Pieces are shared between squares and boards, so they must not be
+        mutated. Use Piece.get to fetch the shared instance; movement state
+        lives on the ChessBoard.
+
         Args:
             piece_type: The type of the piece
             color: Which color/team the piece belongs to
@@ -13,7 +23,19 @@ class Piece:
 
         self.piece_type = piece_type
         self.color = color
-        self.has_moved = False
+        # Small integer in range(12) identifying the (color, type) pair, for list lookups
+        self.id = _COLORS.index(color) * len(_PIECE_TYPES) + _PIECE_TYPES.index(piece_type)
+
+    @classmethod
+    def get(cls, piece_type, color):
+        """
+        Return the shared piece instance for a type and color
+
+        Args:
+            piece_type: The type of the piece
+            color: Which color/team the piece belongs to
+        """
+        return _PIECES[(piece_type, color)]
     
     def __repr__(self):
         return f"{self.color.value}{self.piece_type.value}"
@@ -21,7 +43,13 @@ class Piece:
     def __str__(self):
         return self.__repr__()
     
+# One shared instance per (type, color)
+_PIECES = {(t, c): Piece(t, c) for t in PieceType for c in Color}
+
 class Move:
+    __slots__ = ('from_position', 'to_position', 'is_castling', 'is_en_passant',
+                 'captured_piece', 'promotion_piece')
+
     def __init__(self, from_position, to_position, is_castling, is_en_passant, captured_piece, promotion_piece):
         """
         Initialize a move
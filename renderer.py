@@ -1,5 +1,42 @@
 import pygame
+from collections import OrderedDict
+from functools import lru_cache
 from constants import *
+from piece import Piece
+
+# Pieces offered by the promotion dialog, in dialog order
+_PROMO_BY_COLOR = {
+    color: tuple(Piece.get(piece_type, color)
+                 for piece_type in (PieceType.QUEEN, PieceType.ROOK, PieceType.BISHOP, PieceType.KNIGHT))
+    for color in Color
+}
+
+# Color of every square, indexed by row * 8 + col
+SQUARE_COLORS = tuple(LIGHT_SQUARE if ((index + (index >> 3)) & 1) == 0 else DARK_SQUARE
+                      for index in range(64))
+
+# Display order of captured pieces (by value, high to low) and their material values
+_CAPTURED_SORT_RANK = {PieceType.QUEEN: 0, PieceType.ROOK: 1, PieceType.BISHOP: 2,
+                       PieceType.KNIGHT: 3, PieceType.PAWN: 4}
+_CAPTURED_VALUES = {PieceType.QUEEN: 9, PieceType.ROOK: 5, PieceType.BISHOP: 3,
+                    PieceType.KNIGHT: 3, PieceType.PAWN: 1}
+
+@lru_cache(maxsize=None)
+def _get_font(name, size):
+    """
+    Load a font once for the lifetime of the process
+
+    Args:
+        name: system font name, or None for pygame's default font
+        size: font size
+
+    Returns:
+        pygame Font, shared by every Renderer
+    """
+
+    font = pygame.font.SysFont(name, size) if name else pygame.font.Font(None, size)
+    font.render(' ', True, (0, 0, 0))  # prewarm the glyph cache
+    return font
 
 class Renderer:
     PIECE_SYMBOLS = {
@@ -21,92 +58,331 @@ class Renderer:
         """
         Initialize the renderer
 
+        Must be created after pygame.display.set_mode, since cached surfaces
+        are converted to the display's pixel format.
+
         Args:
             screen: Pygame screen surface
         """
         self.screen = screen
-        self.font = pygame.font.Font(None, 36)
-        self.small_font = pygame.font.Font(None, 24)
-        self.piece_font = pygame.font.SysFont('Apple Symbols', 60)
-        self.small_piece_font = pygame.font.SysFont('Apple Symbols', 24)
-        self.captured_font = pygame.font.SysFont('Apple Symbols', 18)
-    
-    def draw_board(self, board, selected_square = None, valid_moves = None, last_move = None):
+        self._mouse_pos = (0, 0)  # set by begin_frame
+        self.font = _get_font(None, 36)
+        self.small_font = _get_font(None, 24)
+        self.piece_font = _get_font('Apple Symbols', 60)
+        self.small_piece_font = _get_font('Apple Symbols', 24)
+        self.captured_font = _get_font('Apple Symbols', 18)
+
+        # Top-left pixel of every square, indexed [row][col]
+        self._square_px = [[(BOARD_OFFSET + col * SQUARE_SIZE, BOARD_OFFSET + row * SQUARE_SIZE)
+                            for col in range(8)] for row in range(8)]
+
+        # Label centers for the file letters (below the board) and rank numbers (left of it)
+        self._file_positions = [(BOARD_OFFSET + i * SQUARE_SIZE + SQUARE_SIZE // 2, BOARD_OFFSET + BOARD_SIZE + 10)
+                                for i in range(8)]
+        self._rank_positions = [(20, BOARD_OFFSET + i * SQUARE_SIZE + SQUARE_SIZE // 2) for i in range(8)]
+
+        # Button rects of the fixed-layout menus, keyed by game mode (shared, must not be modified)
+        button_x = WINDOW_SIZE // 2 - 150
+        self._menu_rects = {
+            None: (pygame.Rect(button_x, 250, 300, 60),
+                   pygame.Rect(button_x, 350, 300, 60)),
+            'pvb_color_select': (pygame.Rect(button_x, 250, 300, 60),
+                                 pygame.Rect(button_x, 350, 300, 60),
+                                 pygame.Rect(button_x, 470, 300, 60)),
+            'pvb_difficulty_select': (pygame.Rect(button_x, 230, 300, 60),
+                                      pygame.Rect(button_x, 320, 300, 60),
+                                      pygame.Rect(button_x, 410, 300, 60),
+                                      pygame.Rect(button_x, 500, 300, 60)),
+        }
+
+        # Time menu layouts keyed by whether the entered time is valid; the
+        # buttons below the start button move down while the hint is shown
+        input_rects = {
+            'white_minutes': pygame.Rect(WINDOW_SIZE // 2 - 50, 185, 60, 40),
+            'white_seconds': pygame.Rect(WINDOW_SIZE // 2 + 30, 185, 60, 40),
+            'black_minutes': pygame.Rect(WINDOW_SIZE // 2 - 50, 285, 60, 40),
+            'black_seconds': pygame.Rect(WINDOW_SIZE // 2 + 30, 285, 60, 40),
+        }
+        self._time_menu_layouts = {
+            time_valid: {
+                'input_rects': input_rects,
+                'start_button': pygame.Rect(button_x, 380, 300, 50),
+                'no_time_button': pygame.Rect(button_x, 450 if time_valid else 460, 300, 50),
+                'back_button': pygame.Rect(button_x, 520 if time_valid else 530, 300, 50)
+            }
+            for time_valid in (True, False)
+        }
+
+        # Fixed rects of the in-game widgets
+        box_width = 65
+        box_height = 40
+        self._timer_rects = (
+            pygame.Rect(BOARD_OFFSET + BOARD_SIZE + 5, BOARD_OFFSET, box_width, box_height),
+            pygame.Rect(BOARD_OFFSET + BOARD_SIZE + 5, BOARD_OFFSET + BOARD_SIZE - box_height,
+                        box_width, box_height),
+        )
+        self._history_button_rect = pygame.Rect(WINDOW_SIZE - 80, 45, 70, 25)
+
+        # Menu drawing functions keyed by game mode, all called as (layout, time_input)
+        self._menu_draws = {
+            None: lambda layout, time_input: self._draw_main_menu(layout),
+            'pvb_color_select': lambda layout, time_input: self._draw_color_selection_menu(layout),
+            'pvb_difficulty_select': lambda layout, time_input: self._draw_difficulty_selection_menu(layout),
+            'pvp_time_select': self._draw_time_selection_menu,
+        }
+
+        # Pre-rendered menu backgrounds keyed by menu name
+        self._menu_bgs = {}
+
+        # Composed game over overlays keyed by message
+        self._gameover_overlays = {}
+
+        # Rounded widget backgrounds keyed by (size, color, radius, border color)
+        self._widget_bgs = {}
+
+        # Promotion dialog (rects, glyph blits) keyed by (column, color)
+        self._promo_cache = {}
+
+        # Solid square surfaces for each highlight color
+        self._highlight_surfs = {}
+        for color in (HIGHLIGHT_LAST_MOVE, HIGHLIGHT_SELECTED, HIGHLIGHT_CHECK):
+            surf = pygame.Surface((SQUARE_SIZE, SQUARE_SIZE)).convert()
+            surf.fill(color)
+            self._highlight_surfs[color] = surf
+
+        # Valid move markers, drawn once on square-sized transparent surfaces
+        center = (SQUARE_SIZE // 2, SQUARE_SIZE // 2)
+        self._ring_surf = pygame.Surface((SQUARE_SIZE, SQUARE_SIZE), pygame.SRCALPHA).convert_alpha()
+        pygame.draw.circle(self._ring_surf, (100, 100, 100), center, SQUARE_SIZE // 2 - 4, 4)
+        self._dot_surf = pygame.Surface((SQUARE_SIZE, SQUARE_SIZE), pygame.SRCALPHA).convert_alpha()
+        pygame.draw.circle(self._dot_surf, (100, 100, 100), center, SQUARE_SIZE // 6)
+
+        # Board area (squares, highlights and pieces) of the last drawn position
+        self._board_rect = pygame.Rect(BOARD_OFFSET, BOARD_OFFSET, BOARD_SIZE, BOARD_SIZE)
+        self._board_region = None
+        self._board_region_key = None
+
+        # Rendered (surface, width, height) text entries keyed by (font, text, color),
+        # least recently used first
+        self._text_cache = OrderedDict()
+
+        # Rendered clock readings keyed by whole seconds, kept apart from the
+        # text cache so the ticking clocks don't evict the static labels
+        self._time_surfs = {}
+
+        # Piece glyphs rendered once, with the offset that centers each in a square
+        self._piece_surfaces = {}
+        self._piece_offsets = {}
+        for key, symbol in self.PIECE_SYMBOLS.items():
+            glyph = self.piece_font.render(symbol, True,
+                                           (255, 255, 255) if key[0] == Color.WHITE else (0, 0, 0))
+            self._piece_surfaces[key] = glyph.convert_alpha()
+            self._piece_offsets[key] = (SQUARE_SIZE // 2 - glyph.get_width() // 2,
+                                        SQUARE_SIZE // 2 - glyph.get_height() // 2)
+
+        # All glyphs packed side by side into one atlas, with each glyph's area in it
+        atlas_width = sum(glyph.get_width() for glyph in self._piece_surfaces.values())
+        atlas_height = max(glyph.get_height() for glyph in self._piece_surfaces.values())
+        self._piece_atlas = pygame.Surface((atlas_width, atlas_height), pygame.SRCALPHA).convert_alpha()
+        self._piece_rects = [None] * len(self.PIECE_SYMBOLS)  # indexed by Piece.id
+        x = 0
+        for (color, piece_type), glyph in self._piece_surfaces.items():
+            # BLEND_RGBA_MAX onto the transparent atlas copies the pixels unblended
+            self._piece_atlas.blit(glyph, (x, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            piece_id = Piece.get(piece_type, color).id
+            self._piece_rects[piece_id] = pygame.Rect(x, 0, glyph.get_width(), glyph.get_height())
+            x += glyph.get_width()
+
+        # Small glyphs for the captured pieces strip, indexed by Piece.id
+        self._captured_surfaces = [None] * len(self.PIECE_SYMBOLS)
+        for (color, piece_type), symbol in self.PIECE_SYMBOLS.items():
+            glyph = self.captured_font.render(symbol, True,
+                                              (200, 200, 200) if color == Color.WHITE else (60, 60, 60))
+            self._captured_surfaces[Piece.get(piece_type, color).id] = glyph.convert_alpha()
+
+        # Ready-made Surface.blits entries for every glyph on every square,
+        # indexed [snapshot code][row * 8 + col] (code 0 is an empty square)
+        self._glyph_blits = [None] * (len(self.PIECE_SYMBOLS) + 1)
+        for (color, piece_type), (dx, dy) in self._piece_offsets.items():
+            piece_id = Piece.get(piece_type, color).id
+            glyph_rect = self._piece_rects[piece_id]
+            self._glyph_blits[piece_id + 1] = [(self._piece_atlas, (x + dx, y + dy), glyph_rect)
+                                               for row_px in self._square_px for x, y in row_px]
+
+        # Static background (fill, empty board and coordinates), drawn once
+        self._background = self._build_background()
+
+    def begin_frame(self, mouse_pos):
+        """
+        Record the per-frame input state shared by all drawing helpers
+
+        Args:
+            mouse_pos: Mouse position (x, y) for hover effects
+        """
+        self._mouse_pos = mouse_pos
+
+    def _text(self, font, text, color):
+        """
+        Render a line of text antialiased, reusing the surface when the
+        same text was rendered before
+
+        Args:
+            font: Font to render with
+            text: String to render
+            color: Text color
+
+        Returns:
+            Rendered text surface (must not be modified)
+        """
+
+        return self._text_sized(font, text, color)[0]
+
+    def _text_sized(self, font, text, color):
+        """
+        Like _text, but also return the size measured when the text was
+        rendered, so centering it needs no surface queries
+
+        Args:
+            font: Font to render with
+            text: String to render
+            color: Text color
+
+        Returns:
+            (surface, width, height) tuple (surface must not be modified)
+        """
+
+        key = (font, text, color)
+        entry = self._text_cache.get(key)
+        if entry is None:
+            # Keep the cache bounded by dropping the least recently used
+            # text; dynamic strings would otherwise pile up
+            if len(self._text_cache) >= TEXT_CACHE_SIZE:
+                self._text_cache.popitem(last=False)
+            surface = font.render(text, True, color).convert_alpha()
+            entry = self._text_cache[key] = (surface, *surface.get_size())
+        else:
+            self._text_cache.move_to_end(key)
+        return entry
+
+    def _build_background(self):
+        """
+        Pre-render everything on the game screen that never changes
+
+        Returns:
+            Surface the size of the window with the empty board and coordinates
+        """
+
+        background = pygame.Surface((WINDOW_SIZE, WINDOW_SIZE)).convert()
+        background.fill(BG_COLOR)
+
+        for index, color in enumerate(SQUARE_COLORS):
+            x, y = self._square_px[index >> 3][index & 7]
+            background.fill(color, (x, y, SQUARE_SIZE, SQUARE_SIZE))
+
+        self.draw_coordinates(background)
+        return background
+
+    def draw_background(self):
+        """
+        Draw the static game background (replaces filling the screen and
+        drawing the plain squares and coordinates every frame)
+        """
+        self.screen.blit(self._background, (0, 0))
+
+    def draw_board(self, board, selected_square = None, valid_moves = None, last_move = None, snapshot=None):
         """
         Draw the chess board
 
         Args:
             board: ChessBoard instance
             selected_square: Currently selected square or None
-            valid_moves: List of valid moves
+            valid_moves: Collection of valid move squares
             last_move: Tuple of (from_square, to_square) for last move highlighting
+            snapshot: board.snapshot() taken this frame, if the caller has one
         """
 
         valid_moves = valid_moves or []
+        if snapshot is None:
+            snapshot = board.snapshot()
+
+        # Draw highlighted squares (plain squares are part of the background);
+        # later highlights take precedence over earlier ones
+        highlights = []
+
+        # Highlight last move squares
+        if last_move:
+            from_sq, to_sq = last_move
+            highlights.append((from_sq, HIGHLIGHT_LAST_MOVE))
+            highlights.append((to_sq, HIGHLIGHT_LAST_MOVE))
+
+        # Highlight selected square
+        if selected_square:
+            highlights.append((selected_square, HIGHLIGHT_SELECTED))
+
+        # Highlight king in check (the board tracks this per move)
+        check_square = board.king_in_check_square
+        if check_square:
+            highlights.append((check_square, HIGHLIGHT_CHECK))
+
+        # Everything is blitted from pre-drawn surfaces in one batch
+        blit_seq = [(self._highlight_surfs[color], self._square_px[row][col])
+                    for (row, col), color in highlights]
+
+        # Mark valid move squares: a ring around capturable pieces, a dot on
+        # empty squares
+        for row, col in valid_moves:
+            marker = self._ring_surf if snapshot[row * 8 + col] else self._dot_surf
+            blit_seq.append((marker, self._square_px[row][col]))
+        self.screen.blits(blit_seq, doreturn=False)
 
-        # Draw squares
-        for row in range(8):
-            for col in range(8):
-                color = LIGHT_SQUARE if (row + col) % 2 == 0 else DARK_SQUARE
-
-                # Highlight last move squares
-                if last_move:
-                    from_sq, to_sq = last_move
-                    if (row, col) == from_sq or (row, col) == to_sq:
-                        color = HIGHLIGHT_LAST_MOVE
-
-                # Highlight selected square
-                if selected_square == (row, col):
-                    color = HIGHLIGHT_SELECTED
+    def draw_board_region(self, board, selected_square=None, valid_moves=None, last_move=None,
+                          skip_square=None):
+        """
+        Draw the board and its pieces, reusing the last composed board area
+        when nothing on it changed (e.g. while dragging or hovering)
 
-                # Highlight king in check
-                piece = board.get_piece(row, col)
-                if piece and piece.piece_type == PieceType.KING and board.is_in_check(piece.color):
-                    color = HIGHLIGHT_CHECK
+        Args:
+            board: ChessBoard instance
+            selected_square: Currently selected square or None
+            valid_moves: Collection of valid move squares
+            last_move: Tuple of (from_square, to_square) for last move highlighting
+            skip_square: (row, col) to skip drawing (for drag and drop)
+        """
 
-                x = BOARD_OFFSET + col * SQUARE_SIZE
-                y = BOARD_OFFSET + row * SQUARE_SIZE
-                pygame.draw.rect(self.screen, color, (x, y, SQUARE_SIZE, SQUARE_SIZE))
+        # One snapshot of the position serves the cache key and both draws
+        snapshot = board.snapshot()
+        state_key = (snapshot, board.current_turn, selected_square,
+                     frozenset(valid_moves) if valid_moves else None, last_move, skip_square)
+        if state_key == self._board_region_key:
+            self.screen.blit(self._board_region, self._board_rect)
+            return
 
-        # Draw grey circles on valid move squares
-        for row, col in valid_moves:
-            center_x = BOARD_OFFSET + col * SQUARE_SIZE + SQUARE_SIZE // 2
-            center_y = BOARD_OFFSET + row * SQUARE_SIZE + SQUARE_SIZE // 2
-
-            # Check if there's an enemy piece (capture move)
-            piece = board.get_piece(row, col)
-            if piece:
-                # Draw ring for capture moves
-                radius = SQUARE_SIZE // 2 - 4
-                pygame.draw.circle(self.screen, (100, 100, 100), (center_x, center_y), radius, 4)
-            else:
-                # Draw filled circle for empty squares
-                radius = SQUARE_SIZE // 6
-                pygame.draw.circle(self.screen, (100, 100, 100), (center_x, center_y), radius)
+        self.draw_board(board, selected_square, valid_moves, last_move, snapshot)
+        self.draw_pieces(board, skip_square, snapshot)
+        self._board_region = self.screen.subsurface(self._board_rect).copy()
+        self._board_region_key = state_key
 
-    def draw_pieces(self, board, skip_square=None):
+    def draw_pieces(self, board, skip_square=None, snapshot=None):
         """
         Draw chess pieces on the board
 
         Args:
             board: ChessBoard instance
             skip_square: (row, col) to skip drawing (for drag and drop)
+            snapshot: board.snapshot() taken this frame, if the caller has one
         """
 
-        for row in range(8):
-            for col in range(8):
-                # Skip the square being dragged
-                if skip_square and skip_square == (row, col):
-                    continue
+        if snapshot is None:
+            snapshot = board.snapshot()
 
-                piece = board.get_piece(row, col)
-                if piece:
-                    symbol = self.PIECE_SYMBOLS[(piece.color, piece.piece_type)]
-                    text = self.piece_font.render(symbol, True,
-                                            (255, 255, 255) if piece.color == Color.WHITE else (0, 0, 0))
-                    x = BOARD_OFFSET + col * SQUARE_SIZE + SQUARE_SIZE // 2 - text.get_width() // 2
-                    y = BOARD_OFFSET + row * SQUARE_SIZE + SQUARE_SIZE // 2 - text.get_height() // 2
-                    self.screen.blit(text, (x, y))
+        # Skip the square being dragged
+        skip_index = skip_square[0] * 8 + skip_square[1] if skip_square else -1
+
+        # Collect all glyphs and blit them from the atlas in one batch
+        glyph_blits = self._glyph_blits
+        blit_seq = [glyph_blits[code][index] for index, code in enumerate(snapshot)
+                    if code and index != skip_index]
+        self.screen.blits(blit_seq, doreturn=False)
 
     def draw_dragged_piece(self, piece, pos):
         """
@@ -116,28 +392,30 @@ class Renderer:
             piece: The piece being dragged
             pos: Current mouse position (x, y)
         """
-        symbol = self.PIECE_SYMBOLS[(piece.color, piece.piece_type)]
-        text = self.piece_font.render(symbol, True,
-                                     (255, 255, 255) if piece.color == Color.WHITE else (0, 0, 0))
-        # Center the piece on the cursor
-        x = pos[0] - text.get_width() // 2
-        y = pos[1] - text.get_height() // 2
-        self.screen.blit(text, (x, y))
+        # Center the pre-rendered glyph on the cursor
+        glyph_rect = self._piece_rects[piece.id]
+        x = pos[0] - glyph_rect.width // 2
+        y = pos[1] - glyph_rect.height // 2
+        self.screen.blit(self._piece_atlas, (x, y), glyph_rect)
 
-    def draw_coordinates(self):
+    def draw_coordinates(self, surface):
         """
         Draw file and rank labels around board
+
+        Args:
+            surface: Surface to draw the labels onto
         """
 
-        for i, file in enumerate(FILES):
-            text = self.small_font.render(file, True, TEXT_COLOR)
-            x = BOARD_OFFSET + i * SQUARE_SIZE + SQUARE_SIZE // 2 - text.get_width() // 2
-            self.screen.blit(text, (x, BOARD_OFFSET + BOARD_SIZE + 10))
+        blit_seq = []
+        for file, (center_x, y) in zip(FILES, self._file_positions):
+            text = self._text(self.small_font, file, TEXT_COLOR)
+            blit_seq.append((text, (center_x - text.get_width() // 2, y)))
         
-        for i, rank in enumerate(RANKS):
-            text = self.small_font.render(rank, True, TEXT_COLOR)
-            y = BOARD_OFFSET + i * SQUARE_SIZE + SQUARE_SIZE // 2 - text.get_height() // 2
-            self.screen.blit(text, (20, y))
+        for rank, (x, center_y) in zip(RANKS, self._rank_positions):
+            text = self._text(self.small_font, rank, TEXT_COLOR)
+            blit_seq.append((text, (x, center_y - text.get_height() // 2)))
+
+        surface.blits(blit_seq, doreturn=False)
 
     def draw_game_ui(self, board, game_mode, game_over=False, winner=None, timer_info=None, draw_reason=None, show_move_history=False):
         """
@@ -155,17 +433,17 @@ class Renderer:
 
         # turn indicator
         turn_text = "White's turn" if board.current_turn == Color.WHITE else "Black's Turn"
-        text = self.small_font.render(turn_text, True, TEXT_COLOR)
+        text = self._text(self.small_font, turn_text, TEXT_COLOR)
         self.screen.blit(text, (WINDOW_SIZE - 200, 20))
 
         # Check indicator
-        if board.is_in_check(board.current_turn):
-            check_text = self.small_font.render("CHECK!", True, (255, 100, 100))
+        if board.king_in_check_square:
+            check_text = self._text(self.small_font, "CHECK!", (255, 100, 100))
             self.screen.blit(check_text, (WINDOW_SIZE - 200, 50))
 
         # Game mode indicator
         mode_text = "PvP" if game_mode == 'pvp' else "PvBot"
-        text = self.small_font.render(mode_text, True, TEXT_COLOR)
+        text = self._text(self.small_font, mode_text, TEXT_COLOR)
         self.screen.blit(text, (20, 20))
 
         # Draw timers if active
@@ -177,9 +455,9 @@ class Renderer:
 
         # Controls
         controls_text = "ESC: Menu  |  R: Restart  |  Q: Quit"
-        text = self.small_font.render(controls_text, True, TEXT_COLOR)
+        text, text_width, _ = self._text_sized(self.small_font, controls_text, TEXT_COLOR)
 
-        x_pos = WINDOW_SIZE // 2 - text.get_width() // 2
+        x_pos = WINDOW_SIZE // 2 - text_width // 2
         y_pos = BOARD_OFFSET + BOARD_SIZE + 35
         self.screen.blit(text, (x_pos, y_pos))
 
@@ -202,40 +480,54 @@ class Renderer:
         white_time = timer_info['white_time']
         black_time = timer_info['black_time']
 
-        # Format time as MM:SS
-        def format_time(ms):
-            if ms < 0:
-                ms = 0
-            total_seconds = ms // 1000
-            minutes = total_seconds // 60
-            seconds = total_seconds % 60
-            return f"{minutes:02d}:{seconds:02d}"
-
-        # Timer box dimensions
-        box_width = 65
-        box_height = 40
+        black_box, white_box = self.get_timer_rects()
 
         # Black timer (top right of board)
-        black_box = pygame.Rect(BOARD_OFFSET + BOARD_SIZE + 5, BOARD_OFFSET, box_width, box_height)
         black_color = (60, 60, 60) if current_turn == Color.BLACK else (40, 40, 40)
-        pygame.draw.rect(self.screen, black_color, black_box, border_radius=5)
-        pygame.draw.rect(self.screen, (100, 100, 100), black_box, 2, border_radius=5)
+        self.screen.blit(self._widget_bg(black_box.size, black_color, 5, (100, 100, 100)), black_box)
 
-        black_time_text = self.font.render(format_time(black_time), True, TEXT_COLOR)
+        black_time_text = self._time_text(black_time)
         self.screen.blit(black_time_text, (black_box.centerx - black_time_text.get_width() // 2,
                                            black_box.centery - black_time_text.get_height() // 2))
 
         # White timer (bottom right of board)
-        white_box = pygame.Rect(BOARD_OFFSET + BOARD_SIZE + 5, BOARD_OFFSET + BOARD_SIZE - box_height,
-                                box_width, box_height)
         white_color = (80, 80, 80) if current_turn == Color.WHITE else (50, 50, 50)
-        pygame.draw.rect(self.screen, white_color, white_box, border_radius=5)
-        pygame.draw.rect(self.screen, (100, 100, 100), white_box, 2, border_radius=5)
+        self.screen.blit(self._widget_bg(white_box.size, white_color, 5, (100, 100, 100)), white_box)
 
-        white_time_text = self.font.render(format_time(white_time), True, TEXT_COLOR)
+        white_time_text = self._time_text(white_time)
         self.screen.blit(white_time_text, (white_box.centerx - white_time_text.get_width() // 2,
                                            white_box.centery - white_time_text.get_height() // 2))
 
+    def _time_text(self, ms):
+        """
+        Render a clock reading as MM:SS, once per distinct second
+
+        Args:
+            ms: remaining time in milliseconds
+
+        Returns:
+            Rendered text surface (must not be modified)
+        """
+
+        total_seconds = max(ms, 0) // 1000
+        surface = self._time_surfs.get(total_seconds)
+        if surface is None:
+            if len(self._time_surfs) >= TIME_TEXT_CACHE_SIZE:
+                self._time_surfs.clear()
+            minutes, seconds = divmod(total_seconds, 60)
+            surface = self.font.render(f"{minutes:02d}:{seconds:02d}", True, TEXT_COLOR).convert_alpha()
+            self._time_surfs[total_seconds] = surface
+        return surface
+
+    def get_timer_rects(self):
+        """
+        Get the rectangles of the two chess clocks
+
+        Returns:
+            (black_box, white_box) pygame.Rects (shared, must not be modified)
+        """
+        return self._timer_rects
+
     def _draw_captured_pieces(self, board):
         """
         Draw captured pieces display for both players, similar to chess.com style.
@@ -245,20 +537,13 @@ class Renderer:
         """
         captured = board.get_captured_pieces()
 
-        # Piece order by value (high to low)
-        piece_order = [PieceType.QUEEN, PieceType.ROOK, PieceType.BISHOP, PieceType.KNIGHT, PieceType.PAWN]
-        piece_values = {
-            PieceType.QUEEN: 9, PieceType.ROOK: 5, PieceType.BISHOP: 3,
-            PieceType.KNIGHT: 3, PieceType.PAWN: 1
-        }
-
         def sort_pieces(pieces):
             """Sort pieces by value (highest first)"""
-            return sorted(pieces, key=lambda p: piece_order.index(p.piece_type))
+            return sorted(pieces, key=lambda p: _CAPTURED_SORT_RANK[p.piece_type])
 
         def calc_material(pieces):
             """Calculate total material value"""
-            return sum(piece_values.get(p.piece_type, 0) for p in pieces)
+            return sum(_CAPTURED_VALUES.get(p.piece_type, 0) for p in pieces)
 
         # Calculate material advantage
         white_material = calc_material(captured['white'])
@@ -272,31 +557,23 @@ class Renderer:
         # Draw pieces captured by black (white pieces) - below black's timer, going down
         black_captured = sort_pieces(captured['black'])
         y_start_black = BOARD_OFFSET + 45
-        y = y_start_black
-        for piece in black_captured:
-            symbol = self.PIECE_SYMBOLS[(piece.color, piece.piece_type)]
-            text = self.captured_font.render(symbol, True, (200, 200, 200))
-            self.screen.blit(text, (start_x, y))
-            y += piece_spacing
+        self.screen.blits([(self._captured_surfaces[piece.id], (start_x, y_start_black + i * piece_spacing))
+                           for i, piece in enumerate(black_captured)], doreturn=False)
 
         # Show material advantage for black next to first piece
         if advantage < 0 and black_captured:
-            adv_text = self.small_font.render(f"+{-advantage}", True, (150, 150, 150))
+            adv_text = self._text(self.small_font, f"+{-advantage}", (150, 150, 150))
             self.screen.blit(adv_text, (start_x + 20, y_start_black + 2))
 
         # Draw pieces captured by white (black pieces) - above white's timer, going up
         white_captured = sort_pieces(captured['white'])
         y_start_white = BOARD_OFFSET + BOARD_SIZE - 60
-        y = y_start_white
-        for piece in white_captured:
-            symbol = self.PIECE_SYMBOLS[(piece.color, piece.piece_type)]
-            text = self.captured_font.render(symbol, True, (60, 60, 60))
-            self.screen.blit(text, (start_x, y))
-            y -= piece_spacing
+        self.screen.blits([(self._captured_surfaces[piece.id], (start_x, y_start_white - i * piece_spacing))
+                           for i, piece in enumerate(white_captured)], doreturn=False)
 
         # Show material advantage for white next to first piece
         if advantage > 0 and white_captured:
-            adv_text = self.small_font.render(f"+{advantage}", True, (150, 150, 150))
+            adv_text = self._text(self.small_font, f"+{advantage}", (150, 150, 150))
             self.screen.blit(adv_text, (start_x + 20, y_start_white + 2))
 
     def get_history_button_rect(self):
@@ -304,9 +581,9 @@ class Renderer:
         Get the rectangle for the move history toggle button.
 
         Returns:
-            pygame.Rect for the history button
+            pygame.Rect for the history button (shared, must not be modified)
         """
-        return pygame.Rect(WINDOW_SIZE - 80, 45, 70, 25)
+        return self._history_button_rect
 
     def draw_history_button(self, show_move_history):
         """
@@ -316,7 +593,7 @@ class Renderer:
             show_move_history: Whether the panel is currently shown
         """
         button = self.get_history_button_rect()
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = self._mouse_pos
 
         # Button colors
         if button.collidepoint(mouse_pos):
@@ -324,11 +601,11 @@ class Renderer:
         else:
             color = (70, 70, 70)
 
-        pygame.draw.rect(self.screen, color, button, border_radius=5)
+        self.screen.blit(self._widget_bg(button.size, color, 5), button)
 
         # Button text
         btn_text = "Hide" if show_move_history else "Moves"
-        text = self.small_font.render(btn_text, True, TEXT_COLOR)
+        text = self._text(self.small_font, btn_text, TEXT_COLOR)
         self.screen.blit(text, (button.centerx - text.get_width() // 2,
                                 button.centery - text.get_height() // 2))
 
@@ -347,11 +624,10 @@ class Renderer:
 
         # Draw panel background
         panel_rect = pygame.Rect(panel_x, panel_y, panel_width, panel_height)
-        pygame.draw.rect(self.screen, (40, 40, 40), panel_rect, border_radius=10)
-        pygame.draw.rect(self.screen, (100, 100, 100), panel_rect, 2, border_radius=10)
+        self.screen.blit(self._widget_bg(panel_rect.size, (40, 40, 40), 10, (100, 100, 100)), panel_rect)
 
         # Title
-        title = self.font.render("Move History", True, TEXT_COLOR)
+        title = self._text(self.font, "Move History", TEXT_COLOR)
         self.screen.blit(title, (panel_x + panel_width // 2 - title.get_width() // 2, panel_y + 10))
 
         # Get move notation
@@ -375,23 +651,23 @@ class Renderer:
             move_num = i + 1
 
             # Move number
-            num_text = self.small_font.render(f"{move_num}.", True, (150, 150, 150))
+            num_text = self._text(self.small_font, f"{move_num}.", (150, 150, 150))
             self.screen.blit(num_text, (panel_x + 10, y))
 
             # White's move
             white_idx = i * 2
             if white_idx < len(moves):
-                white_move = self.small_font.render(moves[white_idx], True, TEXT_COLOR)
+                white_move = self._text(self.small_font, moves[white_idx], TEXT_COLOR)
                 self.screen.blit(white_move, (panel_x + 40, y))
 
             # Black's move
             black_idx = i * 2 + 1
             if black_idx < len(moves):
-                black_move = self.small_font.render(moves[black_idx], True, TEXT_COLOR)
+                black_move = self._text(self.small_font, moves[black_idx], TEXT_COLOR)
                 self.screen.blit(black_move, (panel_x + 110, y))
 
         # Show hint to close
-        hint = self.small_font.render("Click 'Hide' to close", True, (120, 120, 120))
+        hint = self._text(self.small_font, "Click 'Hide' to close", (120, 120, 120))
         self.screen.blit(hint, (panel_x + panel_width // 2 - hint.get_width() // 2,
                                 panel_y + panel_height - 25))
 
@@ -405,11 +681,6 @@ class Renderer:
             draw_reason: Reason for draw (if applicable)
         """
 
-        overlay = pygame.Surface((WINDOW_SIZE, WINDOW_SIZE))
-        overlay.set_alpha(200)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
-
         if winner == "Draw":
             message = f"Draw - {draw_reason}!" if draw_reason else "Draw!"
         elif winner:
@@ -424,64 +695,121 @@ class Renderer:
         else:
             message = "Draw!"
 
-        text = self.font.render(message, True, TEXT_COLOR)
-        self.screen.blit(text, (WINDOW_SIZE // 2 - text.get_width() // 2, WINDOW_SIZE // 2 - 50))
+        overlay = self._gameover_overlays.get(message)
+        if overlay is None:
+            overlay = self._build_game_over_overlay(message)
+            self._gameover_overlays[message] = overlay
+
+        # The overlay holds premultiplied colors, see _build_game_over_overlay
+        self.screen.blit(overlay, (0, 0), special_flags=pygame.BLEND_PREMULTIPLIED)
+
+    def _build_game_over_overlay(self, message):
+        """
+        Compose the dimmed game over screen with its text
+
+        The text is drawn onto a translucent black surface, which leaves the
+        surface with premultiplied colors. Blitting it with BLEND_PREMULTIPLIED
+        gives the same result as dimming the screen and drawing the text on top.
+
+        Args:
+            message: Game over message
+
+        Returns:
+            Window-sized surface with per-pixel alpha
+        """
+
+        overlay = pygame.Surface((WINDOW_SIZE, WINDOW_SIZE), pygame.SRCALPHA).convert_alpha()
+        overlay.fill((0, 0, 0, 200))
 
-        restart_text = self.small_font.render("Press R to restart or Q to quit", True, TEXT_COLOR)
-        self.screen.blit(restart_text, (WINDOW_SIZE // 2 - restart_text.get_width() // 2,
-                                       WINDOW_SIZE // 2 + 20))
+        text = self._text(self.font, message, TEXT_COLOR)
+        overlay.blit(text, (WINDOW_SIZE // 2 - text.get_width() // 2, WINDOW_SIZE // 2 - 50))
+
+        restart_text = self._text(self.small_font, "Press R to restart or Q to quit", TEXT_COLOR)
+        overlay.blit(restart_text, (WINDOW_SIZE // 2 - restart_text.get_width() // 2,
+                                    WINDOW_SIZE // 2 + 20))
+        return overlay
         
     
-    def draw_menu(self, game_mode=None, time_input=None):
+    def get_menu_layout(self, game_mode=None, time_input=None):
+        """
+        Compute the clickable rects of a menu without drawing anything
+
+        Args:
+            game_mode: Current game mode
+            time_input: Time input state dict (for pvp_time_select)
+
+        Returns:
+            Tuple of buttons or dict with input rects (shared, must not be modified)
+        """
+
+        if game_mode == 'pvp_time_select':
+            return self._time_menu_layouts[time_input['time_valid']]
+        elif game_mode in self._menu_rects:
+            return self._menu_rects[game_mode]
+        else:
+            return self._menu_rects[None]
+
+    def draw_menu(self, game_mode=None, time_input=None, layout=None):
         """
         Draw main menu or selection menus
 
         Args:
             game_mode: Current game mode
             time_input: Time input state dict (for pvp_time_select)
+            layout: Result of get_menu_layout for the same state (computed if omitted)
 
         Returns:
             Tuple of buttons or dict with input rects
         """
 
-        self.screen.fill(BG_COLOR)
+        if layout is None:
+            layout = self.get_menu_layout(game_mode, time_input)
 
-        if game_mode == 'pvb_color_select':
-            return self._draw_color_selection_menu()
-        elif game_mode == 'pvb_difficulty_select':
-            return self._draw_difficulty_selection_menu()
-        elif game_mode == 'pvp_time_select':
-            return self._draw_time_selection_menu(time_input)
-        else:
-            return self._draw_main_menu()
+        draw = self._menu_draws.get(game_mode, self._menu_draws[None])
+        draw(layout, time_input)
+        return layout
         
-    def _draw_main_menu(self):
+    def _draw_main_menu(self, buttons):
         """
         Draw main menu
 
+        Args:
+            buttons: Tuple of button rects from get_menu_layout
+        """
+
+        self._draw_cached_menu('main', buttons, self._build_main_menu_bg, self._main_menu_buttons)
+
+    def _main_menu_buttons(self, buttons):
+        """
+        Describe the main menu buttons
+
+        Args:
+            buttons: Tuple of button rects from get_menu_layout
+
+        Returns:
+            List of (rect, label, font, color, hover color)
+        """
+
+        pvp_button, pvb_button = buttons
+        return [(pvp_button, "Player vs Player", self.small_piece_font, BUTTON_COLOR, BUTTON_HOVER),
+                (pvb_button, "Player vs Bot", self.small_piece_font, BUTTON_COLOR, BUTTON_HOVER)]
+
+    def _build_main_menu_bg(self, buttons):
+        """
+        Pre-render the main menu with no button hovered
+
+        Args:
+            buttons: Tuple of button rects from get_menu_layout
+
         Returns:
-            Tuple of buttons
+            Window-sized surface
         """
 
+        surface = self._new_menu_bg(self._main_menu_buttons(buttons))
+
         # Title
-        title = self.font.render("Chess Game", True, TEXT_COLOR)
-        self.screen.blit(title, (WINDOW_SIZE // 2 - title.get_width() // 2, 100))
-        
-        # Buttons
-        button_width = 300
-        button_height = 60
-        button_x = WINDOW_SIZE // 2 - button_width // 2
-        
-        pvp_button = pygame.Rect(button_x, 250, button_width, button_height)
-        pvb_button = pygame.Rect(button_x, 350, button_width, button_height)
-        
-        mouse_pos = pygame.mouse.get_pos()
-        
-        # PvP Button
-        self._draw_button(pvp_button, "Player vs Player", mouse_pos)
-        
-        # PvB Button
-        self._draw_button(pvb_button, "Player vs Bot", mouse_pos)
+        title = self._text(self.font, "Chess Game", TEXT_COLOR)
+        surface.blit(title, (WINDOW_SIZE // 2 - title.get_width() // 2, 100))
         
         # Instructions
         instructions = [
@@ -494,226 +822,244 @@ class Renderer:
         ]
         
         for i, instruction in enumerate(instructions):
-            text = self.small_font.render(instruction, True, TEXT_COLOR)
-            self.screen.blit(text, (WINDOW_SIZE // 2 - text.get_width() // 2, 500 + i * 30))
-        
-        return pvp_button, pvb_button
+            text = self._text(self.small_font, instruction, TEXT_COLOR)
+            surface.blit(text, (WINDOW_SIZE // 2 - text.get_width() // 2, 500 + i * 30))
+        return surface
     
-    def _draw_color_selection_menu(self):
+    def _draw_color_selection_menu(self, buttons):
         """
         Draw the color selection menu
 
+        Args:
+            buttons: Tuple of button rects from get_menu_layout
+        """
+
+        self._draw_cached_menu('color', buttons, self._build_color_menu_bg, self._color_menu_buttons)
+
+    def _color_menu_buttons(self, buttons):
+        """
+        Describe the color selection menu buttons
+
+        Args:
+            buttons: Tuple of button rects from get_menu_layout
+
         Returns:
-            Tuple of buttons
+            List of (rect, label, font, color, hover color)
         """
 
-        # Title
-        title = self.font.render("Choose Your Color", True, TEXT_COLOR)
-        self.screen.blit(title, (WINDOW_SIZE // 2 - title.get_width() // 2, 100))
+        white_button, black_button, back_button = buttons
+        return [(white_button, "Play as White ♔", self.small_piece_font, BUTTON_COLOR, BUTTON_HOVER),
+                (black_button, "Play as Black ♚", self.small_piece_font, BUTTON_COLOR, BUTTON_HOVER),
+                # Back Button (smaller, different color)
+                (back_button, "← Back to Menu", self.small_piece_font, (70, 70, 70), (100, 100, 100))]
 
-        # Buttons
-        button_width = 300
-        button_height = 60
-        button_x = WINDOW_SIZE // 2 - button_width // 2
-        
-        white_button = pygame.Rect(button_x, 250, button_width, button_height)
-        black_button = pygame.Rect(button_x, 350, button_width, button_height)
-        back_button = pygame.Rect(button_x, 470, button_width, button_height)
-        
-        mouse_pos = pygame.mouse.get_pos()
-        
-        # White Button
-        self._draw_button(white_button, "Play as White ♔", mouse_pos)
-        
-        # Black Button
-        self._draw_button(black_button, "Play as Black ♚", mouse_pos)
-
-        # Back Button (smaller, different color)
-        back_color = (100, 100, 100) if back_button.collidepoint(mouse_pos) else (70, 70, 70)
-        pygame.draw.rect(self.screen, back_color, back_button, border_radius=10)
-        back_text = self.small_piece_font.render("← Back to Menu", True, TEXT_COLOR)
-        self.screen.blit(back_text, (back_button.centerx - back_text.get_width() // 2, 
-                                     back_button.centery - back_text.get_height() // 2))
-        
-        return white_button, black_button, back_button
+    def _build_color_menu_bg(self, buttons):
+        """
+        Pre-render the color selection menu with no button hovered
+
+        Args:
+            buttons: Tuple of button rects from get_menu_layout
+
+        Returns:
+            Window-sized surface
+        """
+
+        surface = self._new_menu_bg(self._color_menu_buttons(buttons))
+
+        # Title
+        title = self._text(self.font, "Choose Your Color", TEXT_COLOR)
+        surface.blit(title, (WINDOW_SIZE // 2 - title.get_width() // 2, 100))
+        return surface
     
-    def _draw_difficulty_selection_menu(self):
+    def _draw_difficulty_selection_menu(self, buttons):
+        """
+        Draw the difficulty selection menu
+
+        Args:
+            buttons: Tuple of button rects from get_menu_layout
+        """
+
+        self._draw_cached_menu('difficulty', buttons, self._build_difficulty_menu_bg,
+                               self._difficulty_menu_buttons)
+
+    def _difficulty_menu_buttons(self, buttons):
+        """
+        Describe the difficulty selection menu buttons
+
+        Args:
+            buttons: Tuple of button rects from get_menu_layout
+
+        Returns:
+            List of (rect, label, font, color, hover color)
+        """
+
+        easy_button, medium_button, hard_button, back_button = buttons
+        return [(easy_button, "Easy", self.small_font, (100, 151, 85), (120, 171, 105)),  # Green tint
+                (medium_button, "Medium", self.small_font, (151, 131, 65), (171, 151, 85)),  # Yellow tint
+                (hard_button, "Hard", self.small_font, (151, 65, 65), (171, 85, 85)),  # Red tint
+                (back_button, "← Back to Menu", self.small_piece_font, (70, 70, 70), (100, 100, 100))]
+
+    def _build_difficulty_menu_bg(self, buttons):
+        """
+        Pre-render the difficulty selection menu with no button hovered
+
+        Args:
+            buttons: Tuple of button rects from get_menu_layout
+
+        Returns:
+            Window-sized surface
+        """
+
+        surface = self._new_menu_bg(self._difficulty_menu_buttons(buttons))
+
         # Title
-        title = self.font.render("Choose Difficulty", True, TEXT_COLOR)
-        self.screen.blit(title, (WINDOW_SIZE // 2 - title.get_width() // 2, 100))
+        title = self._text(self.font, "Choose Difficulty", TEXT_COLOR)
+        surface.blit(title, (WINDOW_SIZE // 2 - title.get_width() // 2, 100))
         
-        subtitle = self.small_font.render("Select AI difficulty level", True, TEXT_COLOR)
-        self.screen.blit(subtitle, (WINDOW_SIZE // 2 - subtitle.get_width() // 2, 150))
+        subtitle = self._text(self.small_font, "Select AI difficulty level", TEXT_COLOR)
+        surface.blit(subtitle, (WINDOW_SIZE // 2 - subtitle.get_width() // 2, 150))
+        return surface
 
-        # Buttons
-        button_width = 300
-        button_height = 60
-        button_x = WINDOW_SIZE // 2 - button_width // 2
-        
-        easy_button = pygame.Rect(button_x, 230, button_width, button_height)
-        medium_button = pygame.Rect(button_x, 320, button_width, button_height)
-        hard_button = pygame.Rect(button_x, 410, button_width, button_height)
-        back_button = pygame.Rect(button_x, 500, button_width, button_height)
-        
-        mouse_pos = pygame.mouse.get_pos()
-
-        # Easy Button (Green tint)
-        easy_color = (120, 171, 105) if easy_button.collidepoint(mouse_pos) else (100, 151, 85)
-        pygame.draw.rect(self.screen, easy_color, easy_button, border_radius=10)
-        easy_text = self.small_font.render("Easy", True, TEXT_COLOR)
-        self.screen.blit(easy_text, (easy_button.centerx - easy_text.get_width() // 2, 
-                                     easy_button.centery - easy_text.get_height() // 2))
-        
-        # Medium Button (Yellow tint)
-        medium_color = (171, 151, 85) if medium_button.collidepoint(mouse_pos) else (151, 131, 65)
-        pygame.draw.rect(self.screen, medium_color, medium_button, border_radius=10)
-        medium_text = self.small_font.render("Medium", True, TEXT_COLOR)
-        self.screen.blit(medium_text, (medium_button.centerx - medium_text.get_width() // 2, 
-                                       medium_button.centery - medium_text.get_height() // 2))
-        
-        # Hard Button (Red tint)
-        hard_color = (171, 85, 85) if hard_button.collidepoint(mouse_pos) else (151, 65, 65)
-        pygame.draw.rect(self.screen, hard_color, hard_button, border_radius=10)
-        hard_text = self.small_font.render("Hard", True, TEXT_COLOR)
-        self.screen.blit(hard_text, (hard_button.centerx - hard_text.get_width() // 2, 
-                                     hard_button.centery - hard_text.get_height() // 2))
-        
-        # Back Button
-        back_color = (100, 100, 100) if back_button.collidepoint(mouse_pos) else (70, 70, 70)
-        pygame.draw.rect(self.screen, back_color, back_button, border_radius=10)
-        back_text = self.small_piece_font.render("← Back to Menu", True, TEXT_COLOR)
-        self.screen.blit(back_text, (back_button.centerx - back_text.get_width() // 2, 
-                                     back_button.centery - back_text.get_height() // 2))
-        
-        return easy_button, medium_button, hard_button, back_button
+    def _new_menu_bg(self, button_specs):
+        """
+        Create a menu background with all of its buttons in their normal color
+
+        Args:
+            button_specs: List of (rect, label, font, color, hover color)
 
-    def _draw_time_selection_menu(self, time_input):
+        Returns:
+            Window-sized surface
         """
-        Draw time control selection menu for PvP
+
+        surface = pygame.Surface((WINDOW_SIZE, WINDOW_SIZE)).convert()
+        surface.fill(BG_COLOR)
+        for rect, label, font, color, _ in button_specs:
+            self._draw_button(surface, rect, label, font, color)
+        return surface
+
+    def _draw_cached_menu(self, name, buttons, build_bg, describe_buttons):
+        """
+        Blit a cached menu background and redraw only the hovered button
 
         Args:
-            time_input: Dict with time input values and active field
+            name: Key of the menu in the background cache
+            buttons: Tuple of button rects from get_menu_layout
+            build_bg: Method that pre-renders the menu
+            describe_buttons: Method that lists the menu's buttons
+        """
+
+        background = self._menu_bgs.get(name)
+        if background is None:
+            background = build_bg(buttons)
+            self._menu_bgs[name] = background
+        self.screen.blit(background, (0, 0))
+
+        mouse_pos = self._mouse_pos
+        for rect, label, font, _, hover_color in describe_buttons(buttons):
+            if rect.collidepoint(mouse_pos):
+                self._draw_button(self.screen, rect, label, font, hover_color)
+                break
+
+    def _build_time_menu_bg(self):
+        """
+        Pre-render the parts of the time control menu that never change
 
         Returns:
-            Dict with input_rects, start_button, no_time_button, back_button
+            Window-sized surface
         """
-        # Title
-        title = self.font.render("Time Control", True, TEXT_COLOR)
-        self.screen.blit(title, (WINDOW_SIZE // 2 - title.get_width() // 2, 80))
 
-        subtitle = self.small_font.render("Set time for each player (or play without time)", True, TEXT_COLOR)
-        self.screen.blit(subtitle, (WINDOW_SIZE // 2 - subtitle.get_width() // 2, 130))
+        surface = pygame.Surface((WINDOW_SIZE, WINDOW_SIZE)).convert()
+        surface.fill(BG_COLOR)
 
-        mouse_pos = pygame.mouse.get_pos()
-        input_rects = {}
+        # Title
+        title = self._text(self.font, "Time Control", TEXT_COLOR)
+        surface.blit(title, (WINDOW_SIZE // 2 - title.get_width() // 2, 80))
+
+        subtitle = self._text(self.small_font, "Set time for each player (or play without time)", TEXT_COLOR)
+        surface.blit(subtitle, (WINDOW_SIZE // 2 - subtitle.get_width() // 2, 130))
 
-        # Input field dimensions
-        field_width = 60
-        field_height = 40
         label_offset = 150
+        colon = self._text(self.font, ":", TEXT_COLOR)
+        min_label = self._text(self.small_font, "min    sec", (150, 150, 150))
+
+        # White and black player rows; the input fields go between the labels
+        for player, y in (("White:", 190), ("Black:", 290)):
+            label = self._text(self.small_font, player, TEXT_COLOR)
+            surface.blit(label, (WINDOW_SIZE // 2 - label_offset, y))
+            surface.blit(colon, (WINDOW_SIZE // 2 + 15, y - 2))
+            surface.blit(min_label, (WINDOW_SIZE // 2 - 45, y + 40))
+        return surface
+
+    def _draw_time_selection_menu(self, layout, time_input):
+        """
+        Draw time control selection menu for PvP
 
-        # White player time
-        white_label = self.small_font.render("White:", True, TEXT_COLOR)
-        self.screen.blit(white_label, (WINDOW_SIZE // 2 - label_offset, 190))
-
-        # White minutes
-        white_min_rect = pygame.Rect(WINDOW_SIZE // 2 - 50, 185, field_width, field_height)
-        input_rects['white_minutes'] = white_min_rect
-        self._draw_input_field(white_min_rect, time_input['white_minutes'],
-                               time_input['active_field'] == 'white_minutes')
-
-        colon1 = self.font.render(":", True, TEXT_COLOR)
-        self.screen.blit(colon1, (WINDOW_SIZE // 2 + 15, 188))
-
-        # White seconds
-        white_sec_rect = pygame.Rect(WINDOW_SIZE // 2 + 30, 185, field_width, field_height)
-        input_rects['white_seconds'] = white_sec_rect
-        self._draw_input_field(white_sec_rect, time_input['white_seconds'],
-                               time_input['active_field'] == 'white_seconds')
-
-        min_label = self.small_font.render("min    sec", True, (150, 150, 150))
-        self.screen.blit(min_label, (WINDOW_SIZE // 2 - 45, 230))
-
-        # Black player time
-        black_label = self.small_font.render("Black:", True, TEXT_COLOR)
-        self.screen.blit(black_label, (WINDOW_SIZE // 2 - label_offset, 290))
-
-        # Black minutes
-        black_min_rect = pygame.Rect(WINDOW_SIZE // 2 - 50, 285, field_width, field_height)
-        input_rects['black_minutes'] = black_min_rect
-        self._draw_input_field(black_min_rect, time_input['black_minutes'],
-                               time_input['active_field'] == 'black_minutes')
-
-        colon2 = self.font.render(":", True, TEXT_COLOR)
-        self.screen.blit(colon2, (WINDOW_SIZE // 2 + 15, 288))
-
-        # Black seconds
-        black_sec_rect = pygame.Rect(WINDOW_SIZE // 2 + 30, 285, field_width, field_height)
-        input_rects['black_seconds'] = black_sec_rect
-        self._draw_input_field(black_sec_rect, time_input['black_seconds'],
-                               time_input['active_field'] == 'black_seconds')
-
-        min_label2 = self.small_font.render("min    sec", True, (150, 150, 150))
-        self.screen.blit(min_label2, (WINDOW_SIZE // 2 - 45, 330))
-
-        # Check if time input is valid (both players must have time > 0)
-        white_min = int(time_input['white_minutes'] or '0')
-        white_sec = int(time_input['white_seconds'] or '0')
-        black_min = int(time_input['black_minutes'] or '0')
-        black_sec = int(time_input['black_seconds'] or '0')
-        white_total = white_min * 60 + white_sec
-        black_total = black_min * 60 + black_sec
-        time_valid = white_total > 0 and black_total > 0
-
-        # Buttons
-        button_width = 300
-        button_height = 50
-        button_x = WINDOW_SIZE // 2 - button_width // 2
+        Args:
+            layout: Dict with input_rects, start_button, no_time_button, back_button
+            time_input: Dict with time input values and active field
+        """
+        # Title, labels and other static text come from the cached background
+        background = self._menu_bgs.get('time')
+        if background is None:
+            background = self._menu_bgs['time'] = self._build_time_menu_bg()
+        self.screen.blit(background, (0, 0))
+
+        mouse_pos = self._mouse_pos
+        input_rects = layout['input_rects']
+
+        # Input fields for both players
+        for field_name in ('white_minutes', 'white_seconds', 'black_minutes', 'black_seconds'):
+            self._draw_input_field(input_rects[field_name], time_input[field_name],
+                                   time_input['active_field'] == field_name)
+
+        # Whether both players have time > 0 (kept up to date by the game)
+        time_valid = time_input['time_valid']
+
+        # Hit-test the buttons once; they don't overlap, so at most one is hovered
+        start_button = layout['start_button']
+        no_time_button = layout['no_time_button']
+        back_button = layout['back_button']
+        hovered = None
+        for button in (start_button, no_time_button, back_button):
+            if button.collidepoint(mouse_pos):
+                hovered = button
+                break
 
         # Start with time button (grayed out if time invalid)
-        start_button = pygame.Rect(button_x, 380, button_width, button_height)
         if time_valid:
-            start_color = BUTTON_HOVER if start_button.collidepoint(mouse_pos) else BUTTON_COLOR
+            start_color = BUTTON_HOVER if hovered is start_button else BUTTON_COLOR
         else:
             start_color = (80, 80, 80)  # Grayed out
-        pygame.draw.rect(self.screen, start_color, start_button, border_radius=10)
-        start_text = self.small_font.render("Start with Time", True, TEXT_COLOR if time_valid else (120, 120, 120))
-        self.screen.blit(start_text, (start_button.centerx - start_text.get_width() // 2,
-                                      start_button.centery - start_text.get_height() // 2))
+        self.screen.blit(self._widget_bg(start_button.size, start_color, 10), start_button)
+        start_text, text_width, text_height = self._text_sized(self.small_font, "Start with Time",
+                                                               TEXT_COLOR if time_valid else (120, 120, 120))
+        self.screen.blit(start_text, (start_button.centerx - text_width // 2,
+                                      start_button.centery - text_height // 2))
 
         # Show hint if time is invalid
         if not time_valid:
-            hint_text = self.small_font.render("(Enter time > 0 for both players)", True, (180, 100, 100))
-            self.screen.blit(hint_text, (WINDOW_SIZE // 2 - hint_text.get_width() // 2, 432))
+            hint_text, text_width, _ = self._text_sized(self.small_font, "(Enter time > 0 for both players)",
+                                                        (180, 100, 100))
+            self.screen.blit(hint_text, (WINDOW_SIZE // 2 - text_width // 2, 432))
 
         # No time button
-        no_time_y = 460 if not time_valid else 450
-        no_time_button = pygame.Rect(button_x, no_time_y, button_width, button_height)
-        no_time_color = (100, 100, 100) if no_time_button.collidepoint(mouse_pos) else (70, 70, 70)
-        pygame.draw.rect(self.screen, no_time_color, no_time_button, border_radius=10)
-        no_time_text = self.small_font.render("Play without Time", True, TEXT_COLOR)
-        self.screen.blit(no_time_text, (no_time_button.centerx - no_time_text.get_width() // 2,
-                                        no_time_button.centery - no_time_text.get_height() // 2))
+        no_time_color = (100, 100, 100) if hovered is no_time_button else (70, 70, 70)
+        self.screen.blit(self._widget_bg(no_time_button.size, no_time_color, 10), no_time_button)
+        no_time_text, text_width, text_height = self._text_sized(self.small_font, "Play without Time", TEXT_COLOR)
+        self.screen.blit(no_time_text, (no_time_button.centerx - text_width // 2,
+                                        no_time_button.centery - text_height // 2))
 
         # Back button
-        back_y = 530 if not time_valid else 520
-        back_button = pygame.Rect(button_x, back_y, button_width, button_height)
-        back_color = (80, 80, 80) if back_button.collidepoint(mouse_pos) else (60, 60, 60)
-        pygame.draw.rect(self.screen, back_color, back_button, border_radius=10)
-        back_text = self.small_piece_font.render("← Back", True, TEXT_COLOR)
-        self.screen.blit(back_text, (back_button.centerx - back_text.get_width() // 2,
-                                     back_button.centery - back_text.get_height() // 2))
+        back_color = (80, 80, 80) if hovered is back_button else (60, 60, 60)
+        self.screen.blit(self._widget_bg(back_button.size, back_color, 10), back_button)
+        back_text, text_width, text_height = self._text_sized(self.small_piece_font, "← Back", TEXT_COLOR)
+        self.screen.blit(back_text, (back_button.centerx - text_width // 2,
+                                     back_button.centery - text_height // 2))
 
         # Instructions
-        hint = self.small_font.render("Click a field to edit, TAB to switch fields", True, (150, 150, 150))
-        self.screen.blit(hint, (WINDOW_SIZE // 2 - hint.get_width() // 2, 600))
-
-        return {
-            'input_rects': input_rects,
-            'start_button': start_button,
-            'no_time_button': no_time_button,
-            'back_button': back_button
-        }
+        hint, text_width, _ = self._text_sized(self.small_font, "Click a field to edit, TAB to switch fields",
+                                               (150, 150, 150))
+        self.screen.blit(hint, (WINDOW_SIZE // 2 - text_width // 2, 600))
 
     def _draw_input_field(self, rect, value, is_active):
         """
@@ -724,35 +1070,59 @@ class Renderer:
             value: Current value string
             is_active: Whether this field is currently active
         """
-        # Background
+        # Background and border
         bg_color = (80, 80, 80) if is_active else (50, 50, 50)
-        pygame.draw.rect(self.screen, bg_color, rect, border_radius=5)
-
-        # Border
         border_color = (130, 151, 105) if is_active else (100, 100, 100)
-        pygame.draw.rect(self.screen, border_color, rect, 2, border_radius=5)
+        self.screen.blit(self._widget_bg(rect.size, bg_color, 5, border_color), rect)
 
         # Text
         display_text = value if value else "00"
-        text = self.font.render(display_text, True, TEXT_COLOR if value else (100, 100, 100))
-        self.screen.blit(text, (rect.centerx - text.get_width() // 2,
-                                rect.centery - text.get_height() // 2))
+        text, text_width, text_height = self._text_sized(self.font, display_text,
+                                                         TEXT_COLOR if value else (100, 100, 100))
+        self.screen.blit(text, (rect.centerx - text_width // 2,
+                                rect.centery - text_height // 2))
+
+    def _widget_bg(self, size, color, radius, border_color=None):
+        """
+        Get a rounded rect with an optional 2px border, drawn once per look
+
+        Args:
+            size: (width, height) of the widget
+            color: fill color
+            radius: corner radius
+            border_color: border color, or None for no border
 
-    def _draw_button(self, rect, text, mouse_pos):
+        Returns:
+            Surface with transparent corners (must not be modified)
         """
-        Draw a button with hover effect
+
+        key = (size, color, radius, border_color)
+        surface = self._widget_bgs.get(key)
+        if surface is None:
+            surface = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+            rect = surface.get_rect()
+            pygame.draw.rect(surface, color, rect, border_radius=radius)
+            if border_color is not None:
+                pygame.draw.rect(surface, border_color, rect, 2, border_radius=radius)
+            self._widget_bgs[key] = surface
+        return surface
+
+    def _draw_button(self, surface, rect, text, font, color):
+        """
+        Draw a rounded button with a centered label
 
         Args:
+            surface: Surface to draw onto
             rect: pygame rect object
             text: what text to put on button
-            mouse_pos: mouse position
+            font: font for the label
+            color: button color
         """
-        color = BUTTON_HOVER if rect.collidepoint(mouse_pos) else BUTTON_COLOR
-        pygame.draw.rect(self.screen, color, rect, border_radius=10)
-        
-        text_surface = self.small_piece_font.render(text, True, TEXT_COLOR)
-        self.screen.blit(text_surface, (rect.centerx - text_surface.get_width() // 2,
-                                       rect.centery - text_surface.get_height() // 2))
+        surface.blit(self._widget_bg(rect.size, color, 10), rect)
+
+        text_surface, text_width, text_height = self._text_sized(font, text, TEXT_COLOR)
+        surface.blit(text_surface, (rect.centerx - text_width // 2,
+                                    rect.centery - text_height // 2))
 
     def get_promotion_rects(self, to_row, to_col, color):
         """
@@ -764,24 +1134,45 @@ class Renderer:
             color: color of the promoting pawn
 
         Returns:
-            List of pygame.Rect for each piece option (Q, R, B, N)
+            Tuple of pygame.Rect for each piece option (Q, R, B, N), shared
+            between calls (must not be modified)
         """
-        # Position dialog above or below the promotion square
-        x = BOARD_OFFSET + to_col * SQUARE_SIZE
+        return self._promotion_options(to_col, color)[0]
 
-        if color == Color.WHITE:
-            # White promotes on row 0, show dialog going down
-            start_y = BOARD_OFFSET
-        else:
-            # Black promotes on row 7, show dialog going up
-            start_y = BOARD_OFFSET + (7 - 3) * SQUARE_SIZE
+    def _promotion_options(self, to_col, color):
+        """
+        Get the promotion dialog rects and the blits of the piece glyphs
+        centered in them, built once per (column, color)
 
-        rects = []
-        for i in range(4):
-            rect = pygame.Rect(x, start_y + i * SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE)
-            rects.append(rect)
+        Args:
+            to_col: destination column of the pawn
+            color: color of the promoting pawn
 
-        return rects
+        Returns:
+            (rects, glyph_blits) tuples in dialog order (Q, R, B, N)
+        """
+        key = (to_col, color)
+        options = self._promo_cache.get(key)
+        if options is None:
+            # Position dialog above or below the promotion square
+            x = BOARD_OFFSET + to_col * SQUARE_SIZE
+
+            if color == Color.WHITE:
+                # White promotes on row 0, show dialog going down
+                start_y = BOARD_OFFSET
+            else:
+                # Black promotes on row 7, show dialog going up
+                start_y = BOARD_OFFSET + (7 - 3) * SQUARE_SIZE
+
+            rects = tuple(pygame.Rect(x, start_y + i * SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE)
+                          for i in range(4))
+            glyph_blits = []
+            for rect, piece in zip(rects, _PROMO_BY_COLOR[color]):
+                glyph_rect = self._piece_rects[piece.id]
+                glyph_pos = (rect.centerx - glyph_rect.width // 2, rect.centery - glyph_rect.height // 2)
+                glyph_blits.append((self._piece_atlas, glyph_pos, glyph_rect))
+            options = self._promo_cache[key] = (rects, tuple(glyph_blits))
+        return options
 
     def draw_promotion_dialog(self, to_row, to_col, color):
         """
@@ -792,38 +1183,28 @@ class Renderer:
             to_col: destination column of the pawn
             color: color of the promoting pawn
         """
-        # Semi-transparent overlay
-        overlay = pygame.Surface((WINDOW_SIZE, WINDOW_SIZE))
-        overlay.set_alpha(150)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
-
-        # Get piece options based on color
-        pieces = [
-            (color, PieceType.QUEEN),
-            (color, PieceType.ROOK),
-            (color, PieceType.BISHOP),
-            (color, PieceType.KNIGHT),
-        ]
-
-        rects = self.get_promotion_rects(to_row, to_col, color)
-        mouse_pos = pygame.mouse.get_pos()
-
-        for i, rect in enumerate(rects):
-            # Draw background (highlight on hover)
-            if rect.collidepoint(mouse_pos):
-                bg_color = (100, 100, 100)
-            else:
-                bg_color = (70, 70, 70)
-
-            pygame.draw.rect(self.screen, bg_color, rect)
-            pygame.draw.rect(self.screen, (150, 150, 150), rect, 2)  # Border
-
-            # Draw piece symbol
-            piece_color, piece_type = pieces[i]
-            symbol = self.PIECE_SYMBOLS[(piece_color, piece_type)]
-            text = self.piece_font.render(symbol, True,
-                                         (255, 255, 255) if piece_color == Color.WHITE else (0, 0, 0))
-            text_x = rect.centerx - text.get_width() // 2
-            text_y = rect.centery - text.get_height() // 2
-            self.screen.blit(text, (text_x, text_y))
\ No newline at end of file
+        # Darken the screen in place; scaling by (255 - 150) / 255 is the same
+        # as blending black over it at alpha 150, without an overlay surface
+        self.screen.fill((105, 105, 105), special_flags=pygame.BLEND_RGB_MULT)
+
+        rects, glyph_blits = self._promotion_options(to_col, color)
+
+        # The options are equal squares stacked in one column, so the hovered
+        # one follows from the mouse position directly
+        mouse_x, mouse_y = self._mouse_pos
+        top = rects[0]
+        hover_index = -1
+        if top.left <= mouse_x < top.right and top.top <= mouse_y < top.top + len(rects) * SQUARE_SIZE:
+            hover_index = (mouse_y - top.top) // SQUARE_SIZE
+
+        # Option backgrounds (highlight on hover) come from the widget cache,
+        # so a frame only blits; the display update already limits itself to
+        # the options whose hover state changed
+        size = rects[0].size
+        normal_bg = self._widget_bg(size, (70, 70, 70), 0, (150, 150, 150))
+        hover_bg = self._widget_bg(size, (100, 100, 100), 0, (150, 150, 150))
+        blit_seq = [(hover_bg if i == hover_index else normal_bg, rect) for i, rect in enumerate(rects)]
+
+        # Then the pre-rendered piece glyphs on top
+        blit_seq.extend(glyph_blits)
+        self.screen.blits(blit_seq, doreturn=False)
\ No newline at end of file